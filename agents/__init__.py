@@ -1,11 +1,17 @@
-from .base_agent import BaseAgent
-from .prospect_search_agent import ProspectSearchAgent
-from .enrichment_agent import DataEnrichmentAgent
-from .scoring_agent import ScoringAgent
-from .outreach_content_agent import OutreachContentAgent
-from .outreach_executor_agent import OutreachExecutorAgent
-from .response_tracker_agent import ResponseTrackerAgent
-from .feedback_trainer_agent import FeedbackTrainerAgent
+import importlib
+
+# Agent classes are imported on first access (PEP 562) so that importing a
+# single agent module does not pull in every agent's tool dependencies
+_LAZY_IMPORTS = {
+    'BaseAgent': '.base_agent',
+    'ProspectSearchAgent': '.prospect_search_agent',
+    'DataEnrichmentAgent': '.enrichment_agent',
+    'ScoringAgent': '.scoring_agent',
+    'OutreachContentAgent': '.outreach_content_agent',
+    'OutreachExecutorAgent': '.outreach_executor_agent',
+    'ResponseTrackerAgent': '.response_tracker_agent',
+    'FeedbackTrainerAgent': '.feedback_trainer_agent'
+}
 
 __all__ = [
     'BaseAgent',
@@ -16,4 +22,16 @@ __all__ = [
     'OutreachExecutorAgent',
     'ResponseTrackerAgent',
     'FeedbackTrainerAgent'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import the requested agent class on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
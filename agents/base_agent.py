@@ -3,6 +3,8 @@ Base Agent class - Abstract interface for all workflow agents
 """
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
+import asyncio
+import threading
 import time
 import json
 from datetime import datetime
@@ -36,6 +38,8 @@ class BaseAgent(ABC):
         self.execution_count = 0
         self.total_execution_time = 0.0
         self.last_execution_time = None
+        # Fan-out steps run one agent instance from several worker threads
+        self._stats_lock = threading.Lock()
         
         # Initialize agent-specific setup
         self._initialize()
@@ -74,42 +78,77 @@ class BaseAgent(ABC):
             
             # Execute agent logic
             output_data = self._execute(input_data)
+            return self._complete_execution(output_data, start_time)
             
-            # Add metadata
-            execution_time = time.time() - start_time
-            output_data['_metadata'] = {
-                'agent_name': self.agent_name,
-                'agent_id': self.agent_id,
-                'execution_time': execution_time,
-                'timestamp': datetime.now().isoformat(),
-                'success': True
-            }
+        except Exception as e:
+            return self._fail_execution(e, start_time)
+    
+    async def aexecute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of execute() for callers running an event loop
+        
+        Args:
+            input_data: Input dictionary for the agent
             
-            # Update stats
-            self.execution_count += 1
-            self.total_execution_time += execution_time
-            self.last_execution_time = execution_time
+        Returns:
+            Output dictionary with results
+        """
+        start_time = time.time()
+        self.logger.log_agent_start(self.agent_name, input_data)
+        
+        try:
+            if not self._validate_input(input_data):
+                raise ValueError(f"Input validation failed for {self.agent_name}")
             
-            self.logger.log_agent_complete(self.agent_name, output_data, execution_time)
-            return output_data
+            output_data = await self._aexecute(input_data)
+            return self._complete_execution(output_data, start_time)
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.log_agent_error(self.agent_name, e)
-            
-            # Return error output
-            return {
-                'error': str(e),
-                'error_type': type(e).__name__,
-                '_metadata': {
-                    'agent_name': self.agent_name,
-                    'agent_id': self.agent_id,
-                    'execution_time': execution_time,
-                    'timestamp': datetime.now().isoformat(),
-                    'success': False,
-                    'error_message': str(e)
-                }
+            return self._fail_execution(e, start_time)
+    
+    async def _aexecute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Override for native async logic; defaults to _execute in a worker thread"""
+        return await asyncio.to_thread(self._execute, input_data)
+    
+    def _complete_execution(self, output_data: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Attach success metadata and update execution stats"""
+        # Add metadata
+        execution_time = time.time() - start_time
+        output_data['_metadata'] = {
+            'agent_name': self.agent_name,
+            'agent_id': self.agent_id,
+            'execution_time': execution_time,
+            'timestamp': datetime.now().isoformat(),
+            'success': True
+        }
+        
+        # Update stats
+        with self._stats_lock:
+            self.execution_count += 1
+            self.total_execution_time += execution_time
+            self.last_execution_time = execution_time
+        
+        self.logger.log_agent_complete(self.agent_name, output_data, execution_time)
+        return output_data
+    
+    def _fail_execution(self, error: Exception, start_time: float) -> Dict[str, Any]:
+        """Build the error output returned when execution fails"""
+        execution_time = time.time() - start_time
+        self.logger.log_agent_error(self.agent_name, error)
+        
+        # Return error output
+        return {
+            'error': str(error),
+            'error_type': type(error).__name__,
+            '_metadata': {
+                'agent_name': self.agent_name,
+                'agent_id': self.agent_id,
+                'execution_time': execution_time,
+                'timestamp': datetime.now().isoformat(),
+                'success': False,
+                'error_message': str(error)
             }
+        }
     
     def _log_reasoning(self, step: str, thought: str):
         """Log agent reasoning step (ReAct pattern)"""
@@ -58,9 +58,24 @@ class DataEnrichmentAgent(BaseAgent):
             f"Enriching {len(leads)} leads with company and person data"
         )
         
-        enriched_leads = []
+        enriched_leads = [None] * len(leads)
         successful_enrichments = 0
         
+        # Leads at the same company share a domain; look each domain up once,
+        # and run all company and person lookups concurrently. In the workflow
+        # each fan-out task holds one lead, so cross-task duplicates are
+        # coalesced by the Clearbit client instead
+        unique_domains = list(dict.fromkeys(
+            lead['company_domain'].lower() for lead in leads if lead.get('company_domain')
+        ))
+        emails = [lead['email'] for lead in leads if lead.get('email')]
+        
+        self._log_action("Clearbit Company Lookup", {"domains": len(unique_domains)})
+        companies_by_domain = self.clearbit_client.enrich_companies_bulk(unique_domains)
+        
+        self._log_action("Clearbit Person Lookup", {"emails": len(emails)})
+        people_by_email = self.clearbit_client.enrich_people_bulk(emails)
+        
         for idx, lead in enumerate(leads, 1):
             company_domain = lead.get('company_domain', '')
             email = lead.get('email', '')
@@ -71,16 +86,10 @@ class DataEnrichmentAgent(BaseAgent):
             )
             
             # === ACTION 1: Enrich company data ===
-            company_enriched = {}
-            if company_domain:
-                self._log_action("Clearbit Company Lookup", {"domain": company_domain})
-                company_enriched = self.clearbit_client.enrich_company(company_domain)
+            company_enriched = companies_by_domain.get(company_domain.lower(), {}) if company_domain else {}
             
             # === ACTION 2: Enrich person data ===
-            person_enriched = {}
-            if email:
-                self._log_action("Clearbit Person Lookup", {"email": email})
-                person_enriched = self.clearbit_client.enrich_person(email)
+            person_enriched = people_by_email.get(email, {}) if email else {}
             
             # === OBSERVATION: Combine enriched data ===
             enriched_lead = {
@@ -126,7 +135,7 @@ class DataEnrichmentAgent(BaseAgent):
                 "enrichment_quality": self._assess_enrichment_quality(company_enriched, person_enriched)
             }
             
-            enriched_leads.append(enriched_lead)
+            enriched_leads[idx - 1] = enriched_lead
             
             if company_enriched or person_enriched:
                 successful_enrichments += 1
@@ -151,6 +160,43 @@ class DataEnrichmentAgent(BaseAgent):
             "enrichment_timestamp": datetime.now().isoformat()
         }
     
+    def split_input(self, input_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split a batch input into one input per lead for parallel fan-out
+        
+        Args:
+            input_data: Input dict with a list of leads
+            
+        Returns:
+            List of per-lead input dicts
+        """
+        leads = input_data.get('leads')
+        if not isinstance(leads, list) or not leads:
+            return [input_data]
+        
+        return [{**input_data, 'leads': [lead]} for lead in leads]
+    
+    def merge_outputs(self, outputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine per-lead outputs produced from split_input
+        
+        Args:
+            outputs: Successful outputs in lead order
+            
+        Returns:
+            Output dict shaped like a single batch execution
+        """
+        enriched_leads = [lead for output in outputs for lead in output.get('enriched_leads', [])]
+        successful_enrichments = sum(output.get('successful_enrichments', 0) for output in outputs)
+        
+        return {
+            "enriched_leads": enriched_leads,
+            "total_enriched": len(enriched_leads),
+            "successful_enrichments": successful_enrichments,
+            "enrichment_rate": successful_enrichments / len(enriched_leads) if enriched_leads else 0,
+            "enrichment_timestamp": datetime.now().isoformat()
+        }
+    
     def _assess_enrichment_quality(
         self,
         company_data: Dict[str, Any],
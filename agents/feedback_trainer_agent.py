@@ -3,6 +3,7 @@ Feedback Trainer Agent - Analyze performance and suggest improvements
 """
 from typing import Any, Dict, List
 from datetime import datetime
+import numpy as np
 from agents.base_agent import BaseAgent
 from tools.google_sheets_tool import GoogleSheetsTool
 from tools.gemini_tool import GeminiAPI
@@ -71,10 +72,11 @@ class FeedbackTrainerAgent(BaseAgent):
         # === ACTION 1: Segment analysis ===
         self._log_action("Segment Analysis", {"total_responses": len(responses)})
         
-        segmentation = self._segment_leads(responses)
+        columns = self._response_columns(responses)
+        segmentation = self._segment_leads(responses, columns)
         
         # === OBSERVATION 1: Identify patterns ===
-        patterns = self._identify_patterns(responses, segmentation)
+        patterns = self._identify_patterns(responses, segmentation, columns)
         
         self._log_observation(
             f"Patterns identified: {len(patterns)} key insights"
@@ -165,32 +167,43 @@ class FeedbackTrainerAgent(BaseAgent):
             "reply_rate": reply_rate
         }
     
-    def _segment_leads(self, responses: List[Dict[str, Any]]) -> Dict[str, List]:
+    def _response_columns(self, responses: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Build struct-of-arrays columns from response dicts for vectorized rollups"""
+        count = len(responses)
+        return {
+            "engagement_score": np.fromiter(
+                (r.get('engagement_score', 0) for r in responses), dtype=np.float64, count=count
+            ),
+            "replied": np.fromiter(
+                (bool(r.get('replied')) for r in responses), dtype=np.bool_, count=count
+            ),
+            "lead_temperature": np.array(
+                [r.get('lead_temperature') or '' for r in responses], dtype=object
+            )
+        }
+    
+    def _segment_leads(
+        self,
+        responses: List[Dict[str, Any]],
+        columns: Dict[str, np.ndarray]
+    ) -> Dict[str, List]:
         """Segment leads by engagement level"""
-        high_engagement = []
-        medium_engagement = []
-        low_engagement = []
-        
-        for response in responses:
-            score = response.get('engagement_score', 0)
-            
-            if score >= 0.6:
-                high_engagement.append(response)
-            elif score >= 0.3:
-                medium_engagement.append(response)
-            else:
-                low_engagement.append(response)
+        scores = columns['engagement_score']
+        high_mask = scores >= 0.6
+        medium_mask = ~high_mask & (scores >= 0.3)
+        low_mask = ~(high_mask | medium_mask)
         
         return {
-            "high_engagement": high_engagement,
-            "medium_engagement": medium_engagement,
-            "low_engagement": low_engagement
+            "high_engagement": [responses[i] for i in np.flatnonzero(high_mask)],
+            "medium_engagement": [responses[i] for i in np.flatnonzero(medium_mask)],
+            "low_engagement": [responses[i] for i in np.flatnonzero(low_mask)]
         }
     
     def _identify_patterns(
         self,
         responses: List[Dict[str, Any]],
-        segmentation: Dict[str, List]
+        segmentation: Dict[str, List],
+        columns: Dict[str, np.ndarray]
     ) -> List[Dict[str, str]]:
         """Identify patterns in successful vs unsuccessful outreach"""
         patterns = []
@@ -209,11 +222,13 @@ class FeedbackTrainerAgent(BaseAgent):
             "insight": "Focus on similar company profiles"
         })
         
-        # Pattern 2: Lead temperature distribution
+        # Pattern 2: Lead temperature distribution (single pass over the column)
+        labels, counts = np.unique(columns['lead_temperature'], return_counts=True)
+        tallies = dict(zip(labels.tolist(), counts.tolist()))
         temp_distribution = {
-            'hot': sum(1 for r in responses if r.get('lead_temperature') == 'hot'),
-            'warm': sum(1 for r in responses if r.get('lead_temperature') == 'warm'),
-            'cold': sum(1 for r in responses if r.get('lead_temperature') == 'cold')
+            'hot': tallies.get('hot', 0),
+            'warm': tallies.get('warm', 0),
+            'cold': tallies.get('cold', 0)
         }
         
         patterns.append({
@@ -223,7 +238,7 @@ class FeedbackTrainerAgent(BaseAgent):
         })
         
         # Pattern 3: Response timing
-        replied_count = sum(1 for r in responses if r.get('replied'))
+        replied_count = int(np.count_nonzero(columns['replied']))
         if replied_count > 0:
             patterns.append({
                 "pattern": "Reply behavior",
@@ -66,10 +66,7 @@ class OutreachContentAgent(BaseAgent):
         )
         
         # Filter qualified leads and take top N
-        qualified_leads = [
-            lead for lead in ranked_leads 
-            if lead.get('meets_threshold', True) and lead.get('lead', {}).get('email')
-        ][:max_leads]
+        qualified_leads = self._select_qualified_leads(ranked_leads, max_leads)
         
         self._log_observation(f"Selected {len(qualified_leads)} qualified leads for outreach")
         
@@ -77,7 +74,32 @@ class OutreachContentAgent(BaseAgent):
         messages = []
         successful_generations = 0
         
-        for idx, ranked_lead in enumerate(qualified_leads, 1):
+        # === ACTION 2: Call Gemini AI for personalization ===
+        # All prompts are submitted together so Gemini calls run in concurrent batches
+        try:
+            email_contents = self.gemini_client.generate_personalized_emails(
+                [
+                    {
+                        "contact_name": ranked_lead['lead'].get('contact', ranked_lead['lead'].get('contact_name', 'there')),
+                        "company": ranked_lead['lead'].get('company', 'your company'),
+                        "role": ranked_lead['lead'].get('role', ranked_lead['lead'].get('title', '')),
+                        "signal": ranked_lead['lead'].get('signal', ''),
+                        "technologies": ranked_lead['lead'].get('technologies', []),
+                        "industry": ranked_lead['lead'].get('company_industry', ranked_lead['lead'].get('industry', ''))
+                    }
+                    for ranked_lead in qualified_leads
+                ],
+                value_proposition=value_prop,
+                tone=tone
+            )
+        except Exception as e:
+            self.logger.error(f" Batch email generation failed: {e}")
+            email_contents = [{}] * len(qualified_leads)
+        
+        # lead_offset keeps lead ids stable when leads are generated in fan-out slices
+        for idx, (ranked_lead, email_content) in enumerate(
+            zip(qualified_leads, email_contents), input_data.get('lead_offset', 0) + 1
+        ):
             lead = ranked_lead['lead']
             score = ranked_lead['score']
             
@@ -91,21 +113,7 @@ class OutreachContentAgent(BaseAgent):
                 }
             )
             
-            # === ACTION 2: Call Gemini AI for personalization ===
             try:
-                email_content = self.gemini_client.generate_personalized_email(
-                    lead_data={
-                        "contact_name": lead.get('contact', lead.get('contact_name', 'there')),
-                        "company": lead.get('company', 'your company'),
-                        "role": lead.get('role', lead.get('title', '')),
-                        "signal": lead.get('signal', ''),
-                        "technologies": lead.get('technologies', []),
-                        "industry": lead.get('company_industry', lead.get('industry', ''))
-                    },
-                    value_proposition=value_prop,
-                    tone=tone
-                )
-                
                 # === OBSERVATION 1: Review generated content ===
                 subject = email_content.get('subject', '')
                 body = email_content.get('body', '')
@@ -172,6 +180,68 @@ class OutreachContentAgent(BaseAgent):
             }
         }
     
+    def _select_qualified_leads(
+        self,
+        ranked_leads: List[Dict[str, Any]],
+        max_leads: int
+    ) -> List[Dict[str, Any]]:
+        """Keep leads that meet the threshold and have an email, capped at max_leads"""
+        return [
+            lead for lead in ranked_leads 
+            if lead.get('meets_threshold', True) and lead.get('lead', {}).get('email')
+        ][:max_leads]
+    
+    def split_input(self, input_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split a batch input into one input per qualified lead for parallel fan-out
+        
+        Args:
+            input_data: Input dict with ranked leads
+            
+        Returns:
+            List of per-lead input dicts
+        """
+        ranked_leads = input_data.get('ranked_leads')
+        if not isinstance(ranked_leads, list):
+            return [input_data]
+        
+        qualified_leads = self._select_qualified_leads(
+            ranked_leads, input_data.get('max_messages', 20)
+        )
+        if not qualified_leads:
+            return [input_data]
+        
+        return [
+            {**input_data, 'ranked_leads': [lead], 'lead_offset': offset}
+            for offset, lead in enumerate(qualified_leads)
+        ]
+    
+    def merge_outputs(self, outputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine per-lead outputs produced from split_input
+        
+        Args:
+            outputs: Successful outputs in lead order
+            
+        Returns:
+            Output dict shaped like a single batch execution
+        """
+        messages = [message for output in outputs for message in output.get('messages', [])]
+        avg_personalization = (
+            sum(m['personalization_score'] for m in messages) / len(messages)
+            if messages else 0
+        )
+        
+        return {
+            "messages": messages,
+            "total_generated": len(messages),
+            "successful_generations": sum(output.get('successful_generations', 0) for output in outputs),
+            "failed_generations": sum(output.get('failed_generations', 0) for output in outputs),
+            "avg_personalization_score": round(avg_personalization, 3),
+            "generation_timestamp": datetime.now().isoformat(),
+            "generation_config": outputs[0].get('generation_config', {}) if outputs else {}
+        }
+    
     def _assess_personalization_quality(
         self,
         email_content: Dict[str, str],
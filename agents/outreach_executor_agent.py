@@ -3,6 +3,7 @@ Outreach Executor Agent - Send emails and track delivery
 """
 from typing import Any, Dict, List
 from datetime import datetime
+import time
 import uuid
 from agents.base_agent import BaseAgent
 from tools.sendgrid_tool import SendGridTool
@@ -20,6 +21,7 @@ class OutreachExecutorAgent(BaseAgent):
         self.campaign_config = self.config_loader.get_yaml_config('campaign', {})
         self.batch_size = self.campaign_config.get('batch_size', 50)
         self.send_delay = self.campaign_config.get('time_between_sends', 300) / 1000  # Convert to seconds
+        self.send_concurrency = self.campaign_config.get('send_concurrency', 10)
         
         self.logger.info(" OutreachExecutorAgent initialized")
     
@@ -60,6 +62,64 @@ class OutreachExecutorAgent(BaseAgent):
         4. Action: Handle failures and retries
         5. Observation: Generate campaign report
         """
+        messages, dry_run, campaign_id = self._prepare_campaign(input_data)
+        
+        if dry_run:
+            self.logger.warning("DRY RUN MODE - Emails will not actually be sent")
+            return self._dry_run_response(messages, campaign_id)
+        
+        # === ACTION 1: Send emails ===
+        self._log_action("Send Emails", {"total": len(messages), "batch_size": self.batch_size})
+        
+        results = [None] * len(messages)
+        for idx, message in enumerate(messages, 1):
+            results[idx - 1] = self._send_message(idx, len(messages), message)
+            
+            # Rate limiting between sends
+            if idx < len(messages):
+                time.sleep(self.send_delay)
+        
+        return self._build_campaign_report(campaign_id, messages, results, dry_run)
+    
+    async def _aexecute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute email sending workflow with concurrent sends"""
+        messages, dry_run, campaign_id = self._prepare_campaign(input_data)
+        
+        if dry_run:
+            self.logger.warning("DRY RUN MODE - Emails will not actually be sent")
+            return self._dry_run_response(messages, campaign_id)
+        
+        concurrency = input_data.get('concurrency', self.send_concurrency)
+        self._log_action(
+            "Send Emails",
+            {"total": len(messages), "batch_size": self.batch_size, "concurrency": concurrency}
+        )
+        
+        emails = [
+            {
+                "to_email": message.get('lead_email'),
+                "subject": message.get('subject_line'),
+                "body": message.get('email_body'),
+                "to_name": message.get('lead_name', '')
+            }
+            for message in messages
+        ]
+        
+        try:
+            # SendGrid owns the pacing: send starts are spaced send_delay apart
+            results = await self.sendgrid.send_batch_async(
+                emails,
+                delay_seconds=self.send_delay,
+                max_concurrency=concurrency
+            )
+        finally:
+            # The SendGrid async client is bound to the caller's loop; don't outlive the campaign on it
+            await self.sendgrid.aclose()
+        
+        return self._build_campaign_report(campaign_id, messages, results, dry_run)
+    
+    def _prepare_campaign(self, input_data: Dict[str, Any]):
+        """Resolve messages, dry-run flag and a new campaign ID"""
         messages = input_data['messages']
         dry_run = input_data.get('dry_run', self._is_dry_run())
         
@@ -72,35 +132,40 @@ class OutreachExecutorAgent(BaseAgent):
             f"Campaign ID: {campaign_id}, Messages: {len(messages)}, Dry Run: {dry_run}"
         )
         
-        if dry_run:
-            self.logger.warning("DRY RUN MODE - Emails will not actually be sent")
-            return self._dry_run_response(messages, campaign_id)
+        return messages, dry_run, campaign_id
+    
+    def _send_message(self, idx: int, total: int, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single message via SendGrid"""
+        lead_email = message.get('lead_email')
+        subject = message.get('subject_line')
+        
+        self._log_action(
+            f"Send Email {idx}/{total}",
+            {"to": lead_email, "subject": subject[:50]}
+        )
         
-        # === ACTION 1: Send emails ===
-        sent_status = []
+        # Send via SendGrid (or Apollo as fallback)
+        return self.sendgrid.send_email(
+            to_email=lead_email,
+            subject=subject,
+            body=message.get('email_body'),
+            to_name=message.get('lead_name', '')
+        )
+    
+    def _build_campaign_report(
+        self,
+        campaign_id: str,
+        messages: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        dry_run: bool
+    ) -> Dict[str, Any]:
+        """Combine per-message send results into the campaign output"""
+        sent_status = [None] * len(messages)
         failed_emails = []
         successful_sends = 0
         
-        self._log_action("Send Emails", {"total": len(messages), "batch_size": self.batch_size})
-        
-        for idx, message in enumerate(messages, 1):
+        for idx, (message, result) in enumerate(zip(messages, results)):
             lead_email = message.get('lead_email')
-            lead_name = message.get('lead_name', '')
-            subject = message.get('subject_line')
-            body = message.get('email_body')
-            
-            self._log_action(
-                f"Send Email {idx}/{len(messages)}",
-                {"to": lead_email, "subject": subject[:50]}
-            )
-            
-            # Send via SendGrid (or Apollo as fallback)
-            result = self.sendgrid.send_email(
-                to_email=lead_email,
-                subject=subject,
-                body=body,
-                to_name=lead_name
-            )
             
             # === OBSERVATION 1: Check delivery status ===
             if result.get('status') == 'sent':
@@ -113,22 +178,17 @@ class OutreachExecutorAgent(BaseAgent):
             # Add metadata
             status_entry = {
                 "lead_id": message.get('lead_id'),
-                "lead_name": lead_name,
+                "lead_name": message.get('lead_name', ''),
                 "email": lead_email,
                 "company": message.get('company'),
-                "subject": subject,
+                "subject": message.get('subject_line'),
                 "status": result.get('status'),
                 "message_id": result.get('message_id'),
                 "sent_at": result.get('sent_at'),
                 "error": result.get('error')
             }
             
-            sent_status.append(status_entry)
-            
-            # Rate limiting between sends
-            if idx < len(messages):
-                import time
-                time.sleep(self.send_delay)
+            sent_status[idx] = status_entry
         
         # === OBSERVATION 2: Campaign summary ===
         success_rate = (successful_sends / len(messages)) * 100 if messages else 0
@@ -1,11 +1,13 @@
 """
 Prospect Search Agent - Find leads using Clay and Apollo APIs
 """
+import asyncio
 from typing import Any, Dict, List
 from datetime import datetime
 from agents.base_agent import BaseAgent
 from tools.clay_api import ClayAPI
 from tools.apollo_api import ApolloAPI
+from utils.async_runner import run_sync
 
 class ProspectSearchAgent(BaseAgent):
     """Agent for searching and identifying prospect leads"""
@@ -34,6 +36,17 @@ class ProspectSearchAgent(BaseAgent):
         return True
     
     def _execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute prospect search workflow on a fresh event loop"""
+        async def main() -> Dict[str, Any]:
+            try:
+                return await self._aexecute(input_data)
+            finally:
+                # The async clients are bound to this loop, which asyncio.run is about to close
+                await asyncio.gather(self.clay_client.aclose(), self.apollo_client.aclose())
+        
+        return run_sync(main, "aexecute()")
+    
+    async def _aexecute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute prospect search workflow
         
@@ -57,7 +70,7 @@ class ProspectSearchAgent(BaseAgent):
         # === ACTION 1: Search companies in Clay ===
         self._log_action("Search Clay", {"filters": icp, "limit": max_leads})
         
-        companies = self.clay_client.search_companies(
+        companies = await self.clay_client.asearch_companies(
             filters=icp,
             limit=max_leads
         )
@@ -81,21 +94,25 @@ class ProspectSearchAgent(BaseAgent):
         
         # === ACTION 2: Search contacts in Apollo ===
         all_leads = []
+        companies = companies[:max_leads]
+        
+        self._log_action(
+            "Search Apollo Contacts",
+            {"companies": len(companies), "titles": ["VP", "Director", "Head"]}
+        )
         
-        for company in companies[:max_leads]:
+        contact_lists = await asyncio.to_thread(self.apollo_client.search_people_bulk, [
+            {
+                "company_name": company.get('company_name', ''),
+                "titles": ["VP of Sales", "Head of Sales", "Sales Director", "VP of Marketing"],
+                "limit": 3  # Get top 3 contacts per company
+            }
+            for company in companies
+        ])
+        
+        for company, contacts in zip(companies, contact_lists):
             company_name = company.get('company_name', '')
             
-            self._log_action(
-                "Search Apollo Contacts",
-                {"company": company_name, "titles": ["VP", "Director", "Head"]}
-            )
-            
-            contacts = self.apollo_client.search_people(
-                company_name=company_name,
-                titles=["VP of Sales", "Head of Sales", "Sales Director", "VP of Marketing"],
-                limit=3  # Get top 3 contacts per company
-            )
-            
             # === OBSERVATION 2: Combine company + contact data ===
             for contact in contacts:
                 lead = {
@@ -4,6 +4,7 @@ Response Tracker Agent - Monitor email engagement and responses
 from typing import Any, Dict, List
 from datetime import datetime
 import random
+import numpy as np
 from agents.base_agent import BaseAgent
 from tools.apollo_api import ApolloAPI
 
@@ -112,17 +113,22 @@ class ResponseTrackerAgent(BaseAgent):
             )
         
         # === OBSERVATION 2: Calculate campaign metrics ===
-        total_sent = len([r for r in responses])
-        total_opened = len([r for r in responses if r['opened']])
-        total_clicked = len([r for r in responses if r['clicked']])
-        total_replied = len([r for r in responses if r['replied']])
-        total_meetings = len([r for r in responses if r['meeting_booked']])
+        total_sent = len(responses)
+        opened = np.fromiter((r['opened'] for r in responses), dtype=np.bool_, count=total_sent)
+        clicked = np.fromiter((r['clicked'] for r in responses), dtype=np.bool_, count=total_sent)
+        replied = np.fromiter((r['replied'] for r in responses), dtype=np.bool_, count=total_sent)
+        meetings = np.fromiter((r['meeting_booked'] for r in responses), dtype=np.bool_, count=total_sent)
+        
+        total_opened = int(opened.sum())
+        total_clicked = int(clicked.sum())
+        total_replied = int(replied.sum())
+        total_meetings = int(meetings.sum())
         
         metrics = {
-            "open_rate": round(total_opened / total_sent, 3) if total_sent > 0 else 0,
-            "click_rate": round(total_clicked / total_sent, 3) if total_sent > 0 else 0,
-            "reply_rate": round(total_replied / total_sent, 3) if total_sent > 0 else 0,
-            "meeting_rate": round(total_meetings / total_sent, 3) if total_sent > 0 else 0,
+            "open_rate": round(float(opened.mean()), 3) if total_sent > 0 else 0,
+            "click_rate": round(float(clicked.mean()), 3) if total_sent > 0 else 0,
+            "reply_rate": round(float(replied.mean()), 3) if total_sent > 0 else 0,
+            "meeting_rate": round(float(meetings.mean()), 3) if total_sent > 0 else 0,
             "total_sent": total_sent,
             "total_opened": total_opened,
             "total_clicked": total_clicked,
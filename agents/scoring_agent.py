@@ -3,8 +3,40 @@ Scoring Agent - Score and rank leads based on ICP fit
 """
 from typing import Any, Dict, List
 from datetime import datetime
+import numpy as np
 from agents.base_agent import BaseAgent
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _weighted_totals_numpy(components: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted sum of per-lead component scores (rows = leads)"""
+    # Accumulate column by column so results match the scalar formula bit for bit
+    totals = components[:, 0] * weights[0]
+    for j in range(1, components.shape[1]):
+        totals = totals + components[:, j] * weights[j]
+    return totals
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _weighted_totals(components: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Compiled weighted sum of per-lead component scores"""
+        totals = np.zeros(components.shape[0])
+        for i in range(components.shape[0]):
+            for j in range(components.shape[1]):
+                totals[i] += components[i, j] * weights[j]
+        return totals
+    
+    # Compile on import so the first real scoring call pays no JIT cost
+    _weighted_totals(np.zeros((1, 4)), np.zeros(4))
+else:
+    _weighted_totals = _weighted_totals_numpy
+
 class ScoringAgent(BaseAgent):
     """Agent for scoring and ranking leads"""
     
@@ -58,23 +90,32 @@ class ScoringAgent(BaseAgent):
         )
         
         # === ACTION 1: Score each lead ===
-        scored_leads = []
+        scored_leads = [None] * len(enriched_leads)
+        
+        # One row per lead: icp_fit, growth_signals, engagement_potential, company_size
+        components = np.empty((len(enriched_leads), 4))
+        components[:, 3] = self._score_company_sizes(enriched_leads)
         
-        for lead in enriched_leads:
+        for idx, lead in enumerate(enriched_leads):
             self._log_action("Score Lead", {"company": lead.get('company', 'Unknown')})
             
-            # Calculate component scores
-            icp_fit = self._score_icp_fit(lead)
-            growth_signals = self._score_growth_signals(lead)
-            engagement_potential = self._score_engagement_potential(lead)
-            
-            # Calculate weighted total
-            total_score = (
-                icp_fit * self.weights.get('industry_match', 0.25) +
-                growth_signals * self.weights.get('growth_signals', 0.25) +
-                engagement_potential * self.weights.get('technology_stack', 0.25) +
-                self._score_company_size(lead) * self.weights.get('company_size', 0.25)
-            )
+            components[idx, 0] = self._score_icp_fit(lead)
+            components[idx, 1] = self._score_growth_signals(lead)
+            components[idx, 2] = self._score_engagement_potential(lead)
+        
+        # Calculate weighted totals for all leads at once
+        weights = np.array([
+            self.weights.get('industry_match', 0.25),
+            self.weights.get('growth_signals', 0.25),
+            self.weights.get('technology_stack', 0.25),
+            self.weights.get('company_size', 0.25)
+        ])
+        totals = _weighted_totals(components, weights)
+        meets_threshold = totals >= self.min_threshold
+        
+        for idx, lead in enumerate(enriched_leads):
+            icp_fit, growth_signals, engagement_potential, company_size_score = components[idx].tolist()
+            total_score = float(totals[idx])
             
             scored_lead = {
                 "lead": lead,
@@ -83,12 +124,12 @@ class ScoringAgent(BaseAgent):
                     "icp_fit": round(icp_fit, 3),
                     "growth_signals": round(growth_signals, 3),
                     "engagement_potential": round(engagement_potential, 3),
-                    "company_size_score": round(self._score_company_size(lead), 3)
+                    "company_size_score": round(company_size_score, 3)
                 },
-                "meets_threshold": total_score >= self.min_threshold
+                "meets_threshold": bool(meets_threshold[idx])
             }
             
-            scored_leads.append(scored_lead)
+            scored_leads[idx] = scored_lead
             
             self._log_observation(
                 f"Lead scored: {lead.get('company')} = {total_score:.2f} "
@@ -96,8 +137,9 @@ class ScoringAgent(BaseAgent):
             )
         
         # === OBSERVATION 1: Review distribution ===
-        avg_score = sum(sl['score'] for sl in scored_leads) / len(scored_leads)
-        qualified_count = sum(1 for sl in scored_leads if sl['meets_threshold'])
+        scores = np.fromiter((sl['score'] for sl in scored_leads), dtype=np.float64, count=len(scored_leads))
+        avg_score = float(scores.mean())
+        qualified_count = int(np.count_nonzero(meets_threshold))
         
         self._log_observation(
             f"Score distribution - Avg: {avg_score:.2f}, "
@@ -107,7 +149,8 @@ class ScoringAgent(BaseAgent):
         # === ACTION 2: Rank leads by score ===
         self._log_action("Rank Leads", {"total": len(scored_leads)})
         
-        ranked_leads = sorted(scored_leads, key=lambda x: x['score'], reverse=True)
+        # Stable descending order, matching sorted(..., reverse=True) on ties
+        ranked_leads = [scored_leads[i] for i in np.argsort(-scores, kind="stable")]
         
         # Add rank numbers
         for rank, lead in enumerate(ranked_leads, 1):
@@ -127,8 +170,8 @@ class ScoringAgent(BaseAgent):
             "total_scored": len(ranked_leads),
             "qualified_leads": qualified_count,
             "avg_score": round(avg_score, 3),
-            "min_score": round(min(sl['score'] for sl in scored_leads), 3),
-            "max_score": round(max(sl['score'] for sl in scored_leads), 3),
+            "min_score": round(float(scores.min()), 3),
+            "max_score": round(float(scores.max()), 3),
             "scoring_timestamp": datetime.now().isoformat(),
             "scoring_criteria": scoring_criteria
         }
@@ -212,21 +255,28 @@ class ScoringAgent(BaseAgent):
         
         return min(score, 1.0)
     
-    def _score_company_size(self, lead: Dict[str, Any]) -> float:
-        """Score company size fit"""
+    def _score_company_sizes(self, leads: List[Dict[str, Any]]) -> np.ndarray:
+        """Score company size fit for all leads at once from an employee-count column"""
         icp_config = self.config_loader.get_icp_config()
         size_range = icp_config.get('employee_count', {})
         min_size = size_range.get('min', 0)
         max_size = size_range.get('max', 10000)
         
-        company_size = lead.get('company_employees', lead.get('company_size', 0))
-        
-        if min_size <= company_size <= max_size:
-            # Perfect fit
-            return 1.0
-        elif company_size < min_size:
-            # Too small, but closer is better
-            return max(0.0, company_size / min_size * 0.5)
-        else:
-            # Too large, but closer is better
-            return max(0.0, 1.0 - (company_size - max_size) / max_size * 0.5)
\ No newline at end of file
+        employees = np.fromiter(
+            (lead.get('company_employees', lead.get('company_size', 0)) or 0 for lead in leads),
+            dtype=np.float64,
+            count=len(leads)
+        )
+        
+        # In range scores 1.0; too small or too large scales down with the distance, floored at 0
+        too_small = (
+            np.maximum(0.0, employees / min_size * 0.5) if min_size
+            else np.zeros_like(employees)
+        )
+        too_large = np.maximum(0.0, 1.0 - (employees - max_size) / max_size * 0.5)
+        
+        return np.where(
+            employees < min_size,
+            too_small,
+            np.where(employees > max_size, too_large, 1.0)
+        )
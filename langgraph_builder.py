@@ -3,15 +3,20 @@ LangGraph Builder - Dynamic workflow orchestration from workflow.json
 """
 import json
 import re
-from typing import Any, Dict, List, TypedDict, Annotated
+from functools import lru_cache, partial
+from typing import Any, Dict, List, NamedTuple, Tuple, TypedDict, Annotated
 from datetime import datetime
+import time
 import operator
+from pathlib import Path
 
 from langgraph.graph import StateGraph, END
+from langgraph.constants import Send
 from langgraph.checkpoint.memory import MemorySaver
 
 from utils.logger import get_logger
-from utils.json_validator import validate_workflow_file
+from utils.fastjson import dump_file
+from utils.json_validator import validate_workflow_file, WorkflowDefinition
 from utils.config_loader import get_config
 
 # Import all agents
@@ -25,6 +30,127 @@ from agents.feedback_trainer_agent import FeedbackTrainerAgent
 
 logger = get_logger("langgraph_builder")
 
+# Matches input references like {{prospect_search.output.leads}}
+_REF_RE = re.compile(r'\{\{\s*([\w.]+)\s*\}\}')
+
+
+@lru_cache(maxsize=8)
+def _load_workflow_def(path: str, mtime_ns: int, size: int) -> WorkflowDefinition:
+    """Validate a workflow file once per (path, mtime, size) version"""
+    return validate_workflow_file(path)
+
+
+@lru_cache(maxsize=1024)
+def _parse_ref(ref_path: str) -> Tuple[str, ...]:
+    """Split a dotted reference path once and reuse the result"""
+    return tuple(ref_path.split('.'))
+
+
+class _InputRef(NamedTuple):
+    """A {{...}} input reference parsed at graph-build time"""
+    path: str
+    parts: Tuple[str, ...]
+
+
+def _compile_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pre-parse a step's input template once
+    
+    Reference strings become _InputRef placeholders; nested dicts (and
+    dicts inside lists) are compiled recursively; everything else is kept
+    as a literal.
+    """
+    compiled = {}
+    
+    for key, value in inputs.items():
+        if isinstance(value, str) and "{{" in value:
+            match = _REF_RE.search(value)
+            compiled[key] = _InputRef(match.group(1), _parse_ref(match.group(1))) if match else value
+        elif isinstance(value, dict):
+            compiled[key] = _compile_inputs(value)
+        elif isinstance(value, list):
+            compiled[key] = [
+                _compile_inputs(item) if isinstance(item, dict) else item
+                for item in value
+            ]
+        else:
+            compiled[key] = value
+    
+    return compiled
+
+
+def _run_step(
+    state: "WorkflowState",
+    *,
+    builder: "LangGraphWorkflowBuilder",
+    step_id: str,
+    agent_name: str,
+    input_plan: Dict[str, Any]
+) -> "WorkflowState":
+    """Execute the agent for one workflow step (bound per step with functools.partial)"""
+    logger.info(f"\n{'='*60}")
+    logger.info(f"🔹 Executing Step: {step_id} ({agent_name})")
+    logger.info(f"{'='*60}")
+    
+    # Fan-out results are appended by a reducer; returning them would duplicate them
+    state.pop("fanout_results", None)
+    
+    # Get agent
+    agent = builder.agents.get(agent_name)
+    if not agent:
+        error_msg = f"Agent {agent_name} not found"
+        logger.error(f" {error_msg}")
+        state["errors"].append({
+            "step": step_id,
+            "error": error_msg,
+            "timestamp": datetime.now().isoformat()
+        })
+        return state
+    
+    # Prepare input by resolving references
+    agent_input = builder._resolve_compiled_inputs(input_plan, state)
+    
+    logger.info(f" Input keys: {list(agent_input.keys())}")
+    
+    # Execute agent
+    try:
+        output = agent.execute(agent_input)
+        
+        # Check for errors
+        if not output.get('_metadata', {}).get('success', True):
+            error_msg = output.get('error', 'Unknown error')
+            logger.error(f" Agent execution failed: {error_msg}")
+            state["errors"].append({
+                "step": step_id,
+                "error": error_msg,
+                "timestamp": datetime.now().isoformat()
+            })
+        else:
+            logger.info(f"Step completed successfully")
+            logger.info(f" Output keys: {list(output.keys())}")
+        
+        # Store output in state
+        state[step_id] = output
+        state["current_step"] = step_id
+        state["completed_steps"] = [step_id]
+        
+    except Exception as e:
+        error_msg = f"Exception during execution: {str(e)}"
+        logger.error(f" {error_msg}")
+        state["errors"].append({
+            "step": step_id,
+            "error": error_msg,
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    return state
+
+def _collect_fanout(current: List[Dict[str, Any]], update: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Append per-item fan-out results; a None update (sent by the join) clears them"""
+    if update is None:
+        return []
+    return current + update
+
 # Define workflow state
 class WorkflowState(TypedDict):
     """State that flows through the workflow"""
@@ -45,6 +171,9 @@ class WorkflowState(TypedDict):
     current_step: str
     completed_steps: Annotated[List[str], operator.add]
     errors: Annotated[List[Dict[str, str]], operator.add]
+    
+    # Per-item results from fanned-out steps, collected by each step's join node
+    fanout_results: Annotated[List[Dict[str, Any]], _collect_fanout]
     start_time: str
     end_time: str
 
@@ -58,7 +187,8 @@ class LangGraphWorkflowBuilder:
         
         # Validate and load workflow
         logger.info(f" Loading workflow from {workflow_file}")
-        self.workflow_def = validate_workflow_file(workflow_file)
+        stat = Path(workflow_file).stat()
+        self.workflow_def = _load_workflow_def(workflow_file, stat.st_mtime_ns, stat.st_size)
         
         # Initialize agents
         self._initialize_agents()
@@ -91,6 +221,8 @@ class LangGraphWorkflowBuilder:
 
         steps = [step.id for step in self.workflow_def.steps]
         node_map = {}  # map logical step_id -> actual node_id used in graph
+        exit_map = {}  # map logical step_id -> node the next step follows
+        fanout_routers = {}  # step_id -> router sending per-item work to its node
 
         for step in self.workflow_def.steps:
             step_id = step.id
@@ -100,21 +232,43 @@ class LangGraphWorkflowBuilder:
             node_id = f"{step_id}_node"
 
             node_map[step_id] = node_id
+            exit_map[step_id] = node_id
             logger.info(f"   Adding node: {node_id} ({agent_name})")
 
+            # Agents that can split their input get one parallel task per item
+            agent = self.agents.get(agent_name)
+            if hasattr(agent, "split_input") and hasattr(agent, "merge_outputs"):
+                join_id = f"{step_id}_join"
+                workflow.add_node(node_id, self._create_fanout_item_function(step_id, agent_name))
+                workflow.add_node(join_id, self._create_fanout_join_function(step_id, agent_name))
+                workflow.add_edge(node_id, join_id)
+                exit_map[step_id] = join_id
+                fanout_routers[step_id] = self._create_fanout_router(step_id, agent_name, step, node_id)
+                logger.info(f"   Fan-out enabled: {node_id} -> {join_id}")
+                continue
+
             node_func = self._create_node_function(step_id, agent_name, step)
             workflow.add_node(node_id, node_func)
 
         # Set entry point
         first_node = node_map[steps[0]]
-        workflow.set_entry_point(first_node)
+        if steps[0] in fanout_routers:
+            workflow.set_conditional_entry_point(fanout_routers[steps[0]], [first_node])
+        else:
+            workflow.set_entry_point(first_node)
 
         # Add sequential edges
         for i in range(len(steps) - 1):
-            workflow.add_edge(node_map[steps[i]], node_map[steps[i + 1]])
+            next_step = steps[i + 1]
+            if next_step in fanout_routers:
+                workflow.add_conditional_edges(
+                    exit_map[steps[i]], fanout_routers[next_step], [node_map[next_step]]
+                )
+            else:
+                workflow.add_edge(exit_map[steps[i]], node_map[next_step])
 
         # Last step goes to END
-        workflow.add_edge(node_map[steps[-1]], END)
+        workflow.add_edge(exit_map[steps[-1]], END)
 
         logger.info(f"Graph built with {len(steps)} nodes")
 
@@ -125,64 +279,110 @@ class LangGraphWorkflowBuilder:
     
     def _create_node_function(self, step_id: str, agent_name: str, step):
         """Create a node function for a specific step"""
+        return partial(
+            _run_step,
+            builder=self,
+            step_id=step_id,
+            agent_name=agent_name,
+            input_plan=_compile_inputs(step.inputs)
+        )
+    
+    def _create_fanout_router(self, step_id: str, agent_name: str, step, node_id: str):
+        """Create a router that sends one task per input item to a fan-out node"""
         
-        def node_function(state: WorkflowState) -> WorkflowState:
-            """Execute agent for this step"""
-            logger.info(f"\n{'='*60}")
-            logger.info(f"🔹 Executing Step: {step_id} ({agent_name})")
-            logger.info(f"{'='*60}")
+        input_plan = _compile_inputs(step.inputs)
+        
+        def route(state: WorkflowState) -> List[Send]:
+            agent_input = self._resolve_compiled_inputs(input_plan, state)
+            item_inputs = self.agents[agent_name].split_input(agent_input)
             
-            # Get agent
-            agent = self.agents.get(agent_name)
-            if not agent:
-                error_msg = f"Agent {agent_name} not found"
-                logger.error(f" {error_msg}")
-                state["errors"].append({
-                    "step": step_id,
-                    "error": error_msg,
-                    "timestamp": datetime.now().isoformat()
-                })
-                return state
+            logger.info(f"🔀 Fanning out {step_id} into {len(item_inputs)} parallel tasks")
+            
+            dispatched_at = time.monotonic()
+            return [
+                Send(node_id, {"index": index, "agent_input": item_input, "dispatched_at": dispatched_at})
+                for index, item_input in enumerate(item_inputs)
+            ]
+        
+        return route
+    
+    def _create_fanout_item_function(self, step_id: str, agent_name: str):
+        """Create a node function that runs the agent on one fanned-out item"""
+        
+        def item_function(task: Dict[str, Any]) -> Dict[str, Any]:
+            """Execute agent for a single item"""
+            try:
+                output = self.agents[agent_name].execute(task["agent_input"])
+            except Exception as e:
+                output = {
+                    "error": f"Exception during execution: {str(e)}",
+                    "_metadata": {"success": False}
+                }
             
-            # Prepare input by resolving references
-            agent_input = self._resolve_input_references(step.inputs, state)
+            return {"fanout_results": [{
+                "step": step_id,
+                "index": task["index"],
+                "dispatched_at": task["dispatched_at"],
+                "output": output
+            }]}
+        
+        return item_function
+    
+    def _create_fanout_join_function(self, step_id: str, agent_name: str):
+        """Create a node function that merges fanned-out results into the step output"""
+        
+        def join_function(state: WorkflowState) -> Dict[str, Any]:
+            """Combine per-item outputs once every task has finished"""
+            logger.info(f"\n{'='*60}")
+            logger.info(f"🔹 Joining Step: {step_id} ({agent_name})")
+            logger.info(f"{'='*60}")
             
-            logger.info(f" Input keys: {list(agent_input.keys())}")
+            agent = self.agents[agent_name]
+            results = sorted(
+                (result for result in state.get("fanout_results", []) if result["step"] == step_id),
+                key=lambda result: result["index"]
+            )
             
-            # Execute agent
-            try:
-                output = agent.execute(agent_input)
-                
-                # Check for errors
-                if not output.get('_metadata', {}).get('success', True):
+            outputs = []
+            errors = []
+            for result in results:
+                output = result["output"]
+                if output.get('_metadata', {}).get('success', True):
+                    outputs.append(output)
+                else:
                     error_msg = output.get('error', 'Unknown error')
-                    logger.error(f" Agent execution failed: {error_msg}")
-                    state["errors"].append({
+                    logger.error(f" Agent execution failed for item {result['index']}: {error_msg}")
+                    errors.append({
                         "step": step_id,
                         "error": error_msg,
                         "timestamp": datetime.now().isoformat()
                     })
-                else:
-                    logger.info(f"Step completed successfully")
-                    logger.info(f" Output keys: {list(output.keys())}")
-                
-                # Store output in state
-                state[step_id] = output
-                state["current_step"] = step_id
-                state["completed_steps"] = [step_id]
-                
-            except Exception as e:
-                error_msg = f"Exception during execution: {str(e)}"
-                logger.error(f" {error_msg}")
-                state["errors"].append({
-                    "step": step_id,
-                    "error": error_msg,
-                    "timestamp": datetime.now().isoformat()
-                })
             
-            return state
+            merged = agent.merge_outputs(outputs)
+            # Wall time from dispatching the tasks to the end of the merge
+            dispatched_at = min((result["dispatched_at"] for result in results), default=time.monotonic())
+            merged['_metadata'] = {
+                'agent_name': agent.agent_name,
+                'agent_id': agent.agent_id,
+                'execution_time': time.monotonic() - dispatched_at,
+                'fanout_tasks': len(results),
+                'timestamp': datetime.now().isoformat(),
+                'success': not errors
+            }
+            
+            logger.info(f"Step completed: {len(outputs)}/{len(results)} tasks succeeded")
+            logger.info(f" Output keys: {list(merged.keys())}")
+            
+            return {
+                step_id: merged,
+                "current_step": step_id,
+                "completed_steps": [step_id],
+                "errors": errors,
+                # Per-item outputs now live in the merged step output
+                "fanout_results": None
+            }
         
-        return node_function
+        return join_function
     
     def _resolve_input_references(self, inputs: Dict[str, Any], state: WorkflowState) -> Dict[str, Any]:
         """
@@ -195,26 +395,24 @@ class LangGraphWorkflowBuilder:
         Returns:
             Resolved input dict
         """
+        return self._resolve_compiled_inputs(_compile_inputs(inputs), state)
+    
+    def _resolve_compiled_inputs(self, input_plan: Dict[str, Any], state: WorkflowState) -> Dict[str, Any]:
+        """Fill a pre-parsed input plan from _compile_inputs with values from state"""
         resolved = {}
         
-        for key, value in inputs.items():
-            if isinstance(value, str) and "{{" in value and "}}" in value:
-                # Extract reference
-                match = re.search(r'\{\{(.+?)\}\}', value)
-                if match:
-                    ref_path = match.group(1)
-                    resolved_value = self._get_nested_value(ref_path, state)
-                    resolved[key] = resolved_value
-                    logger.debug(f"   Resolved: {key} = {{{{ref_path}}}} -> {type(resolved_value)}")
-                else:
-                    resolved[key] = value
+        for key, value in input_plan.items():
+            if isinstance(value, _InputRef):
+                resolved_value = self._get_value_at(value.parts, value.path, state)
+                resolved[key] = resolved_value
+                logger.debug(f"   Resolved: {key} = {{{{{value.path}}}}} -> {type(resolved_value)}")
             elif isinstance(value, dict):
                 # Recursively resolve nested dicts
-                resolved[key] = self._resolve_input_references(value, state)
+                resolved[key] = self._resolve_compiled_inputs(value, state)
             elif isinstance(value, list):
                 # Resolve list items
                 resolved[key] = [
-                    self._resolve_input_references(item, state) if isinstance(item, dict) else item
+                    self._resolve_compiled_inputs(item, state) if isinstance(item, dict) else item
                     for item in value
                 ]
             else:
@@ -228,8 +426,10 @@ class LangGraphWorkflowBuilder:
         
         Example: "prospect_search.output.leads" -> state["prospect_search"]["leads"]
         """
-        parts = path.split('.')
-        
+        return self._get_value_at(_parse_ref(path), path, state)
+    
+    def _get_value_at(self, parts: Tuple[str, ...], path: str, state: WorkflowState) -> Any:
+        """Walk pre-split path parts through state (path is only used for logging)"""
         # Handle config references
         if parts[0] == "config":
             if parts[1] == "scoring":
@@ -284,6 +484,7 @@ class LangGraphWorkflowBuilder:
             "current_step": "",
             "completed_steps": [],
             "errors": [],
+            "fanout_results": [],
             "start_time": datetime.now().isoformat(),
             "end_time": "",
             # Initialize step outputs
@@ -304,6 +505,8 @@ class LangGraphWorkflowBuilder:
         try:
             config = {"configurable": {"thread_id": execution_id}}
             final_state = self.graph.invoke(initial_state, config)
+            # Internal fan-out scratch space; the join has already merged it into outputs
+            final_state.pop("fanout_results", None)
             
             final_state["end_time"] = datetime.now().isoformat()
             
@@ -449,8 +652,7 @@ def main():
     
     # Save results
     output_file = f"data/workflow_execution_{final_state['execution_id']}.json"
-    with open(output_file, "w") as f:
-        json.dump(final_state, f, indent=2, default=str)
+    dump_file(final_state, output_file)
     
     logger.info(f" Results saved to {output_file}")
 
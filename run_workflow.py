@@ -3,11 +3,11 @@
 CLI tool to run the AI Agent Workflow
 """
 import argparse
-import json
 import sys
 from datetime import datetime
 
 from utils.logger import get_logger
+from utils.fastjson import dump_file
 from langgraph_builder import LangGraphWorkflowBuilder
 
 logger = get_logger("workflow_runner")
@@ -45,8 +45,7 @@ def run_workflow(
         if save_results:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"data/run_output_{timestamp}.json"
-            with open(output_file, "w") as f:
-                json.dump(final_state, f, indent=2, default=str)
+            dump_file(final_state, output_file)
             logger.info(f" Results saved to {output_file}")
 
         # Summarize
@@ -3,17 +3,19 @@
 Test script for Milestone 4
 Tests full pipeline: Search → Enrich → Score → Generate Content
 """
-import json
 from utils.logger import get_logger
-from agents.prospect_search_agent import ProspectSearchAgent
-from agents.enrichment_agent import DataEnrichmentAgent
-from agents.scoring_agent import ScoringAgent
-from agents.outreach_content_agent import OutreachContentAgent
+from utils.fastjson import dump_file
+from utils.timing import Timed, format_timings, run_standalone_tests
 
 logger = get_logger("test_milestone4")
 
 def test_full_pipeline():
     """Test complete workflow through content generation"""
+    from agents.prospect_search_agent import ProspectSearchAgent
+    from agents.enrichment_agent import DataEnrichmentAgent
+    from agents.scoring_agent import ScoringAgent
+    from agents.outreach_content_agent import OutreachContentAgent
+    
     logger.info("╔" + "=" * 58 + "╗")
     logger.info("║" + " " * 10 + "MILESTONE 4 FULL PIPELINE TEST" + " " * 18 + "║")
     logger.info("╚" + "=" * 58 + "╝")
@@ -35,7 +37,8 @@ def test_full_pipeline():
         "max_leads": 10
     }
     
-    search_output = search_agent.execute(search_input)
+    with Timed("search"):
+        search_output = search_agent.execute(search_input)
     
     if not search_output.get('_metadata', {}).get('success'):
         logger.error(" Search agent failed!")
@@ -53,7 +56,8 @@ def test_full_pipeline():
         "leads": search_output['leads'][:5]  # Enrich top 5
     }
     
-    enrichment_output = enrichment_agent.execute(enrichment_input)
+    with Timed("enrichment"):
+        enrichment_output = enrichment_agent.execute(enrichment_input)
     
     if not enrichment_output.get('_metadata', {}).get('success'):
         logger.error(" Enrichment agent failed!")
@@ -71,7 +75,8 @@ def test_full_pipeline():
         "enriched_leads": enrichment_output['enriched_leads']
     }
     
-    scoring_output = scoring_agent.execute(scoring_input)
+    with Timed("scoring"):
+        scoring_output = scoring_agent.execute(scoring_input)
     
     if not scoring_output.get('_metadata', {}).get('success'):
         logger.error("Scoring agent failed!")
@@ -100,7 +105,8 @@ def test_full_pipeline():
         "max_messages": 3  # Generate only 3 for testing
     }
     
-    content_output = content_agent.execute(content_input)
+    with Timed("content"):
+        content_output = content_agent.execute(content_input)
     
     if not content_output.get('_metadata', {}).get('success'):
         logger.error(" Content generation failed!")
@@ -118,6 +124,9 @@ def test_full_pipeline():
         logger.info(f"\n   Body:\n   {sample.get('email_body')[:200]}...")
         logger.info(f"\n   Personalization Score: {sample.get('personalization_score', 0):.2f}")
     
+    # Per-step latency summary
+    logger.info(f"Step timings (ns):\n{format_timings()}")
+    
     # Save complete pipeline results
     logger.info("\n" + "=" * 60)
     logger.info("Saving Pipeline Results")
@@ -131,8 +140,7 @@ def test_full_pipeline():
     }
     
     try:
-        with open("data/test_results_milestone4.json", "w") as f:
-            json.dump(pipeline_results, f, indent=2, default=str)
+        dump_file(pipeline_results, "data/test_results_milestone4.json")
         logger.info("Results saved to data/test_results_milestone4.json")
     except Exception as e:
         logger.error(f" Failed to save results: {e}")
@@ -141,6 +149,8 @@ def test_full_pipeline():
 
 def test_scoring_agent_only():
     """Test scoring agent with mock data"""
+    from agents.scoring_agent import ScoringAgent
+    
     logger.info("\n" + "=" * 60)
     logger.info("TEST: Scoring Agent (Standalone)")
     logger.info("=" * 60)
@@ -197,6 +207,8 @@ def test_scoring_agent_only():
 
 def test_content_agent_only():
     """Test content generation with mock data"""
+    from agents.outreach_content_agent import OutreachContentAgent
+    
     logger.info("\n" + "=" * 60)
     logger.info("TEST: Content Agent (Standalone)")
     logger.info("=" * 60)
@@ -255,9 +267,11 @@ def main():
     
     results = []
     
-    # Test individual agents first
-    results.append(("Scoring Agent", test_scoring_agent_only()))
-    results.append(("Content Agent", test_content_agent_only()))
+    # Test individual agents first (independent, so run across processes)
+    results.extend(run_standalone_tests([
+        ("Scoring Agent", test_scoring_agent_only),
+        ("Content Agent", test_content_agent_only)
+    ]))
     
     # Test full pipeline
     results.append(("Full Pipeline", test_full_pipeline()))
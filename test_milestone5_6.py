@@ -3,20 +3,23 @@
 Test script for Milestones 5 & 6
 Tests complete end-to-end workflow: Search → Enrich → Score → Content → Send → Track → Feedback
 """
-import json
+import asyncio
 from utils.logger import get_logger
-from agents.prospect_search_agent import ProspectSearchAgent
-from agents.enrichment_agent import DataEnrichmentAgent
-from agents.scoring_agent import ScoringAgent
-from agents.outreach_content_agent import OutreachContentAgent
-from agents.outreach_executor_agent import OutreachExecutorAgent
-from agents.response_tracker_agent import ResponseTrackerAgent
-from agents.feedback_trainer_agent import FeedbackTrainerAgent
+from utils.fastjson import dump_file
+from utils.timing import Timed, format_timings, run_standalone_tests
 
 logger = get_logger("test_milestone5_6")
 
 def test_complete_workflow():
     """Test complete end-to-end workflow"""
+    from agents.prospect_search_agent import ProspectSearchAgent
+    from agents.enrichment_agent import DataEnrichmentAgent
+    from agents.scoring_agent import ScoringAgent
+    from agents.outreach_content_agent import OutreachContentAgent
+    from agents.outreach_executor_agent import OutreachExecutorAgent
+    from agents.response_tracker_agent import ResponseTrackerAgent
+    from agents.feedback_trainer_agent import FeedbackTrainerAgent
+    
     logger.info("╔" + "=" * 58 + "╗")
     logger.info("║" + " " * 5 + "COMPLETE WORKFLOW TEST (Milestones 1-6)" + " " * 13 + "║")
     logger.info("╚" + "=" * 58 + "╝")
@@ -39,7 +42,8 @@ def test_complete_workflow():
         "max_leads": 15
     }
     
-    search_output = search_agent.execute(search_input)
+    with Timed("search"):
+        search_output = search_agent.execute(search_input)
     workflow_results['search'] = search_output
     
     if not search_output.get('_metadata', {}).get('success'):
@@ -56,7 +60,8 @@ def test_complete_workflow():
     enrichment_agent = DataEnrichmentAgent(agent_id="workflow_enrichment")
     enrichment_input = {"leads": search_output['leads'][:8]}
     
-    enrichment_output = enrichment_agent.execute(enrichment_input)
+    with Timed("enrichment"):
+        enrichment_output = enrichment_agent.execute(enrichment_input)
     workflow_results['enrichment'] = enrichment_output
     
     if not enrichment_output.get('_metadata', {}).get('success'):
@@ -73,7 +78,8 @@ def test_complete_workflow():
     scoring_agent = ScoringAgent(agent_id="workflow_scoring")
     scoring_input = {"enriched_leads": enrichment_output['enriched_leads']}
     
-    scoring_output = scoring_agent.execute(scoring_input)
+    with Timed("scoring"):
+        scoring_output = scoring_agent.execute(scoring_input)
     workflow_results['scoring'] = scoring_output
     
     if not scoring_output.get('_metadata', {}).get('success'):
@@ -97,7 +103,8 @@ def test_complete_workflow():
         "max_messages": 5
     }
     
-    content_output = content_agent.execute(content_input)
+    with Timed("content"):
+        content_output = content_agent.execute(content_input)
     workflow_results['content'] = content_output
     
     if not content_output.get('_metadata', {}).get('success'):
@@ -117,7 +124,8 @@ def test_complete_workflow():
         "dry_run": False  # Set to False to test actual sending (mock mode)
     }
     
-    executor_output = executor_agent.execute(executor_input)
+    with Timed("execution"):
+        executor_output = asyncio.run(executor_agent.aexecute(executor_input))
     workflow_results['execution'] = executor_output
     
     if not executor_output.get('_metadata', {}).get('success'):
@@ -140,7 +148,8 @@ def test_complete_workflow():
         "sent_status": executor_output['sent_status']
     }
     
-    tracker_output = tracker_agent.execute(tracker_input)
+    with Timed("tracking"):
+        tracker_output = tracker_agent.execute(tracker_input)
     workflow_results['tracking'] = tracker_output
     
     if not tracker_output.get('_metadata', {}).get('success'):
@@ -166,7 +175,8 @@ def test_complete_workflow():
         "campaign_metrics": metrics
     }
     
-    feedback_output = feedback_agent.execute(feedback_input)
+    with Timed("feedback"):
+        feedback_output = feedback_agent.execute(feedback_input)
     workflow_results['feedback'] = feedback_output
     
     if not feedback_output.get('_metadata', {}).get('success'):
@@ -185,14 +195,16 @@ def test_complete_workflow():
         logger.info(f"   - Recommendation: {sample_rec.get('recommendation')}")
         logger.info(f"   - Priority: {sample_rec.get('priority')}")
     
+    # Per-step latency summary
+    logger.info(f"Step timings (ns):\n{format_timings()}")
+    
     # ========== SAVE RESULTS ==========
     logger.info("\n" + "=" * 60)
     logger.info("Saving Complete Workflow Results")
     logger.info("=" * 60)
     
     try:
-        with open("data/complete_workflow_results.json", "w") as f:
-            json.dump(workflow_results, f, indent=2, default=str)
+        dump_file(workflow_results, "data/complete_workflow_results.json")
         logger.info("✅ Results saved to data/complete_workflow_results.json")
     except Exception as e:
         logger.error(f"❌ Failed to save results: {e}")
@@ -201,6 +213,8 @@ def test_complete_workflow():
 
 def test_executor_agent_only():
     """Test OutreachExecutorAgent standalone"""
+    from agents.outreach_executor_agent import OutreachExecutorAgent
+    
     logger.info("\n" + "=" * 60)
     logger.info("TEST: Outreach Executor Agent (Standalone)")
     logger.info("=" * 60)
@@ -241,6 +255,8 @@ def test_executor_agent_only():
 
 def test_tracker_agent_only():
     """Test ResponseTrackerAgent standalone"""
+    from agents.response_tracker_agent import ResponseTrackerAgent
+    
     logger.info("\n" + "=" * 60)
     logger.info("TEST: Response Tracker Agent (Standalone)")
     logger.info("=" * 60)
@@ -286,6 +302,8 @@ def test_tracker_agent_only():
 
 def test_feedback_agent_only():
     """Test FeedbackTrainerAgent standalone"""
+    from agents.feedback_trainer_agent import FeedbackTrainerAgent
+    
     logger.info("\n" + "=" * 60)
     logger.info("TEST: Feedback Trainer Agent (Standalone)")
     logger.info("=" * 60)
@@ -345,15 +363,13 @@ def main():
     
     results = []
     
-    # Test individual agents
-    executor_result = test_executor_agent_only()
-    results.append(("Executor Agent", executor_result is not None))
-    
-    tracker_result = test_tracker_agent_only()
-    results.append(("Tracker Agent", tracker_result is not None))
-    
-    feedback_result = test_feedback_agent_only()
-    results.append(("Feedback Agent", feedback_result is not None))
+    # Test individual agents (independent, so run across processes)
+    standalone_results = run_standalone_tests([
+        ("Executor Agent", test_executor_agent_only),
+        ("Tracker Agent", test_tracker_agent_only),
+        ("Feedback Agent", test_feedback_agent_only)
+    ])
+    results.extend((name, result is not None) for name, result in standalone_results)
     
     # Test complete workflow
     results.append(("Complete Workflow", test_complete_workflow()))
@@ -3,70 +3,134 @@
 Test script for Milestone 7 - LangGraph Orchestration
 Tests complete workflow execution through LangGraph
 """
-import json
+import functools
+import os
+import threading
+from concurrent.futures import Future
 from utils.logger import get_logger
+from utils.fastjson import dump_file
 from langgraph_builder import LangGraphWorkflowBuilder
 
 logger = get_logger("test_milestone7")
 
+# Graph rendering can shell out or hit the network; keep it off the test path
+VIZ_TIMEOUT_SECONDS = 2.0
+
+
+def _run_in_daemon(fn) -> Future:
+    """Run fn on a daemon thread; unlike pool workers, a stuck render can't block interpreter exit"""
+    future: Future = Future()
+    
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=target, name="graph-render", daemon=True).start()
+    return future
+
+# Banner pieces, built once
+_SEP = "=" * 60
+_DSEP = "=" * 58
+_BANNER = "\n".join([
+    f"╔{_DSEP}╗",
+    f"║{' ' * 10}{'MILESTONE 7 TEST SUITE':<48}║",
+    f"║{' ' * 10}{'LangGraph Orchestration':<48}║",
+    f"╚{_DSEP}╝\n"
+])
+_SUCCESS_FOOTER = "\n".join([
+    "\n" + "🎉" * 20,
+    "🎉 ALL MILESTONES COMPLETE! 🎉",
+    "🎉" * 20,
+    "\n✨ You've successfully built:",
+    "   ✓ Dynamic workflow orchestration with LangGraph",
+    "   ✓ 7 specialized AI agents",
+    "   ✓ Complete lead generation pipeline",
+    "   ✓ AI-powered personalization (Gemini)",
+    "   ✓ Email execution & tracking",
+    "   ✓ Feedback loop with human approval",
+    "   ✓ Checkpointing & state management",
+    "\n📂 Output files:",
+    "   - data/langgraph_execution_*.json",
+    "   - logs/test_milestone7_*.log",
+    "\n🚀 Usage:",
+    "   python langgraph_builder.py --info       # Show workflow info",
+    "   python langgraph_builder.py --visualize  # Visualize graph",
+    "   python langgraph_builder.py              # Execute workflow"
+])
+
+@functools.cache
+def _builder() -> LangGraphWorkflowBuilder:
+    """Load workflow.json and compile the graph once for every test"""
+    builder = LangGraphWorkflowBuilder("workflow.json")
+    builder.build_graph()
+    return builder
+
 def test_workflow_info():
     """Test getting workflow information"""
-    logger.info("="*60)
-    logger.info("TEST 1: Workflow Information")
-    logger.info("="*60)
+    logger.info("%s", _SEP)
+    logger.info("TEST %d: %s", 1, "Workflow Information")
+    logger.info("%s", _SEP)
     
     try:
-        builder = LangGraphWorkflowBuilder("workflow.json")
+        builder = _builder()
         info = builder.get_workflow_info()
         
-        logger.info(f"✅ Workflow loaded successfully")
-        logger.info(f"\n   Name: {info['workflow_name']}")
-        logger.info(f"   Description: {info['description']}")
-        logger.info(f"   Total Steps: {info['total_steps']}")
-        logger.info(f"\n   Steps:")
+        logger.info("✅ Workflow loaded successfully")
+        logger.info("\n   Name: %s", info['workflow_name'])
+        logger.info("   Description: %s", info['description'])
+        logger.info("   Total Steps: %s", info['total_steps'])
+        logger.info("\n   Steps:")
         
         for i, step in enumerate(info['steps'], 1):
-            logger.info(f"   {i}. {step['id']} ({step['agent']})")
+            logger.info("   %d. %s (%s)", i, step['id'], step['agent'])
         
         return True
     except Exception as e:
-        logger.error(f"❌ Failed to load workflow: {e}")
+        logger.error("❌ Failed to load workflow: %s", e)
         return False
 
 def test_graph_building():
     """Test LangGraph construction"""
-    logger.info("\n" + "="*60)
-    logger.info("TEST 2: Graph Building")
-    logger.info("="*60)
+    logger.info("\n%s", _SEP)
+    logger.info("TEST %d: %s", 2, "Graph Building")
+    logger.info("%s", _SEP)
     
     try:
-        builder = LangGraphWorkflowBuilder("workflow.json")
-        graph = builder.build_graph()
+        builder = _builder()
+        graph = builder.graph
         
-        logger.info(f"✅ Graph built successfully")
-        logger.info(f"   Nodes: {len(builder.workflow_def.steps)}")
-        logger.info(f"   Checkpointing: Enabled")
+        logger.info("✅ Graph built successfully")
+        logger.info("   Nodes: %d", len(builder.workflow_def.steps))
+        logger.info("   Checkpointing: Enabled")
         
         # Try to visualize (optional)
-        try:
-            builder.visualize_graph()
-        except Exception as viz_error:
-            logger.info(f"ℹ️  Visualization skipped: {viz_error}")
+        if os.environ.get("SKIP_VIZ") or os.environ.get("CI"):
+            logger.info("ℹ️  Visualization skipped: disabled by environment")
+        else:
+            viz_future = _run_in_daemon(builder.visualize_graph)
+            try:
+                viz_future.result(timeout=VIZ_TIMEOUT_SECONDS)
+            except Exception as viz_error:
+                logger.info("ℹ️  Visualization skipped: %s", viz_error or type(viz_error).__name__)
         
         return True
     except Exception as e:
-        logger.error(f"❌ Failed to build graph: {e}")
+        logger.error("❌ Failed to build graph: %s", e)
         return False
 
 def test_full_workflow_execution():
     """Test complete workflow execution through LangGraph"""
-    logger.info("\n" + "="*60)
-    logger.info("TEST 3: Full Workflow Execution")
-    logger.info("="*60)
+    logger.info("\n%s", _SEP)
+    logger.info("TEST %d: %s", 3, "Full Workflow Execution")
+    logger.info("%s", _SEP)
     
     try:
         # Build and execute workflow
-        builder = LangGraphWorkflowBuilder("workflow.json")
+        builder = _builder()
         
         logger.info("🚀 Starting workflow execution...")
         
@@ -76,75 +140,77 @@ def test_full_workflow_execution():
         completed_steps = final_state.get("completed_steps", [])
         errors = final_state.get("errors", [])
         
-        logger.info(f"\n✅ Workflow execution completed")
-        logger.info(f"   Steps completed: {len(completed_steps)}")
-        logger.info(f"   Errors: {len(errors)}")
+        logger.info("\n✅ Workflow execution completed")
+        logger.info("   Steps completed: %d", len(completed_steps))
+        logger.info("   Errors: %d", len(errors))
         
         # Check each step's output
-        logger.info(f"\n📊 Step Results:")
+        logger.info("\n📊 Step Results:")
         
         # Prospect Search
         if final_state.get("prospect_search"):
             ps = final_state["prospect_search"]
-            logger.info(f"   ✓ Prospect Search: {ps.get('total_found', 0)} leads found")
+            logger.info("   ✓ Prospect Search: %s leads found", ps.get('total_found', 0))
         
         # Enrichment
         if final_state.get("enrichment"):
             enrich = final_state["enrichment"]
-            logger.info(f"   ✓ Enrichment: {enrich.get('total_enriched', 0)} leads enriched")
+            logger.info("   ✓ Enrichment: %s leads enriched", enrich.get('total_enriched', 0))
         
         # Scoring
         if final_state.get("scoring"):
             score = final_state["scoring"]
-            logger.info(f"   ✓ Scoring: Avg score {score.get('avg_score', 0):.2f}")
+            logger.info("   ✓ Scoring: Avg score %.2f", score.get('avg_score', 0))
         
         # Content Generation
         if final_state.get("outreach_content"):
             content = final_state["outreach_content"]
-            logger.info(f"   ✓ Content: {content.get('total_generated', 0)} emails generated")
+            logger.info("   ✓ Content: %s emails generated", content.get('total_generated', 0))
         
         # Email Sending
         if final_state.get("send"):
             send = final_state["send"]
-            logger.info(f"   ✓ Send: {send.get('total_sent', 0)} emails sent ({send.get('success_rate', 0):.1%} success)")
+            logger.info(
+                "   ✓ Send: %s emails sent (%.1f%% success)",
+                send.get('total_sent', 0), send.get('success_rate', 0) * 100
+            )
         
         # Response Tracking
         if final_state.get("response_tracking"):
             track = final_state["response_tracking"]
             metrics = track.get('metrics', {})
-            logger.info(f"   ✓ Tracking: {metrics.get('open_rate', 0):.1%} open, {metrics.get('reply_rate', 0):.1%} reply")
+            logger.info(
+                "   ✓ Tracking: %.1f%% open, %.1f%% reply",
+                metrics.get('open_rate', 0) * 100, metrics.get('reply_rate', 0) * 100
+            )
         
         # Feedback
         if final_state.get("feedback_trainer"):
             feedback = final_state["feedback_trainer"]
-            logger.info(f"   ✓ Feedback: {feedback.get('total_recommendations', 0)} recommendations")
+            logger.info("   ✓ Feedback: %s recommendations", feedback.get('total_recommendations', 0))
         
         # Save results
         execution_id = final_state.get("execution_id")
         output_file = f"data/langgraph_execution_{execution_id}.json"
         
-        with open(output_file, "w") as f:
-            json.dump(final_state, f, indent=2, default=str)
+        dump_file(final_state, output_file)
         
-        logger.info(f"\n💾 Results saved to {output_file}")
+        logger.info("\n💾 Results saved to %s", output_file)
         
         return len(errors) == 0
         
     except Exception as e:
-        logger.error(f"❌ Workflow execution failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Workflow execution failed: %s", e)
         return False
 
 def test_state_management():
     """Test state management and reference resolution"""
-    logger.info("\n" + "="*60)
-    logger.info("TEST 4: State Management")
-    logger.info("="*60)
+    logger.info("\n%s", _SEP)
+    logger.info("TEST %d: %s", 4, "State Management")
+    logger.info("%s", _SEP)
     
     try:
-        builder = LangGraphWorkflowBuilder("workflow.json")
-        builder.build_graph()
+        builder = _builder()
         
         # Test reference resolution
         test_state = {
@@ -191,18 +257,17 @@ def test_state_management():
         return True
         
     except Exception as e:
-        logger.error(f"❌ State management test failed: {e}")
+        logger.error("❌ State management test failed: %s", e)
         return False
 
 def test_checkpointing():
     """Test workflow checkpointing"""
-    logger.info("\n" + "="*60)
-    logger.info("TEST 5: Checkpointing")
-    logger.info("="*60)
+    logger.info("\n%s", _SEP)
+    logger.info("TEST %d: %s", 5, "Checkpointing")
+    logger.info("%s", _SEP)
     
     try:
-        builder = LangGraphWorkflowBuilder("workflow.json")
-        builder.build_graph()
+        builder = _builder()
         
         logger.info("✅ Checkpointing enabled with MemorySaver")
         logger.info("   Workflow state can be resumed after interruption")
@@ -211,17 +276,17 @@ def test_checkpointing():
         return True
         
     except Exception as e:
-        logger.error(f"❌ Checkpointing test failed: {e}")
+        logger.error("❌ Checkpointing test failed: %s", e)
         return False
 
 def test_error_handling():
     """Test error handling in workflow"""
-    logger.info("\n" + "="*60)
-    logger.info("TEST 6: Error Handling")
-    logger.info("="*60)
+    logger.info("\n%s", _SEP)
+    logger.info("TEST %d: %s", 6, "Error Handling")
+    logger.info("%s", _SEP)
     
     try:
-        builder = LangGraphWorkflowBuilder("workflow.json")
+        builder = _builder()
         
         # Test with invalid initial state
         try:
@@ -234,21 +299,18 @@ def test_error_handling():
             logger.info("✅ Builder handles initialization properly")
             
         except Exception as inner_e:
-            logger.warning(f"⚠️  Expected error handling: {inner_e}")
+            logger.warning("⚠️  Expected error handling: %s", inner_e)
         
         logger.info("✅ Error handling test passed")
         return True
         
     except Exception as e:
-        logger.error(f"❌ Error handling test failed: {e}")
+        logger.error("❌ Error handling test failed: %s", e)
         return False
 
 def main():
     """Run all Milestone 7 tests"""
-    logger.info("╔" + "=" * 58 + "╗")
-    logger.info("║" + " " * 10 + "MILESTONE 7 TEST SUITE" + " " * 26 + "║")
-    logger.info("║" + " " * 10 + "LangGraph Orchestration" + " " * 25 + "║")
-    logger.info("╚" + "=" * 58 + "╝\n")
+    logger.info("%s", _BANNER)
     
     results = []
     
@@ -261,39 +323,22 @@ def main():
     results.append(("Full Execution", test_full_workflow_execution()))
     
     # Summary
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST SUMMARY")
-    logger.info("=" * 60)
-    
     passed = sum(1 for _, result in results if result)
     total = len(results)
     
+    lines = ["", _SEP, "TEST SUMMARY", _SEP]
     for test_name, result in results:
         status = "✅ PASSED" if result else "❌ FAILED"
-        logger.info(f"{status}: {test_name}")
+        lines.append(f"{status}: {test_name}")
     
-    logger.info(f"\n🎯 Results: {passed}/{total} tests passed ({(passed/total)*100:.0f}%)")
+    lines.append(f"\n🎯 Results: {passed}/{total} tests passed ({(passed/total)*100:.0f}%)")
     
     if passed == total:
-        logger.info("\n" + "🎉"*20)
-        logger.info("🎉 ALL MILESTONES COMPLETE! 🎉")
-        logger.info("🎉"*20)
-        logger.info("\n✨ You've successfully built:")
-        logger.info("   ✓ Dynamic workflow orchestration with LangGraph")
-        logger.info("   ✓ 7 specialized AI agents")
-        logger.info("   ✓ Complete lead generation pipeline")
-        logger.info("   ✓ AI-powered personalization (Gemini)")
-        logger.info("   ✓ Email execution & tracking")
-        logger.info("   ✓ Feedback loop with human approval")
-        logger.info("   ✓ Checkpointing & state management")
-        logger.info("\n📂 Output files:")
-        logger.info("   - data/langgraph_execution_*.json")
-        logger.info("   - logs/test_milestone7_*.log")
-        logger.info("\n🚀 Usage:")
-        logger.info("   python langgraph_builder.py --info       # Show workflow info")
-        logger.info("   python langgraph_builder.py --visualize  # Visualize graph")
-        logger.info("   python langgraph_builder.py              # Execute workflow")
-    else:
+        lines.append(_SUCCESS_FOOTER)
+    
+    logger.info("\n".join(lines))
+    
+    if passed != total:
         logger.warning("\n⚠️  Some tests failed. Review errors above.")
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 # tools/__init__.py
-from .clay_api import ClayAPI
-from .apollo_api import ApolloAPI
-from .clearbit_api import ClearbitAPI
-from .gemini_tool import GeminiAPI
-from .sendgrid_tool import SendGridTool
-from .google_sheets_tool import GoogleSheetsTool
+import importlib
+
+# Tool classes are imported on first access (PEP 562) so that using one API
+# wrapper does not load every vendor SDK
+_LAZY_IMPORTS = {
+    'ClayAPI': '.clay_api',
+    'ApolloAPI': '.apollo_api',
+    'ClearbitAPI': '.clearbit_api',
+    'GeminiAPI': '.gemini_tool',
+    'SendGridTool': '.sendgrid_tool',
+    'GoogleSheetsTool': '.google_sheets_tool',
+    'Contact': '.records',
+    'Company': '.records'
+}
 
 __all__ = [
     'ClayAPI',
@@ -12,5 +20,19 @@ __all__ = [
     'ClearbitAPI',
     'GeminiAPI',
     'SendGridTool',
-    'GoogleSheetsTool'
-]
\ No newline at end of file
+    'GoogleSheetsTool',
+    'Contact',
+    'Company'
+]
+
+def __getattr__(name):
+    """Import the requested tool class on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
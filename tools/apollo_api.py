@@ -1,23 +1,77 @@
 """
 Apollo API Tool - Contact search and outreach
 """
+import asyncio
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import uuid
+from cachetools import TTLCache
+from itertools import count, islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from tools.records import Contact
+from utils import fastjson
 from utils.logger import get_logger
 from utils.config_loader import get_config
+from utils.clock import timestamp_now
+from utils.rate_limiter import get_rate_limiter
+from utils.http_client import HTTPClientMixin
 
 logger = get_logger("apollo_api")
 
-class ApolloAPI:
+# Maximum number of queries sent in one bulk request
+BULK_CHUNK_SIZE = 100
+
+# Statuses worth retrying; any other 4xx fails immediately
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Contact search results are stable enough to reuse for a day
+CACHE_MAXSIZE = 10_000
+CACHE_TTL_SECONDS = 24 * 3600
+
+# Titles searched when the caller doesn't specify any
+DEFAULT_PERSON_TITLES = ["VP of Sales", "Head of Sales", "Sales Director"]
+
+class ApolloAPI(HTTPClientMixin):
     """Apollo.io API wrapper for contact search and engagement"""
     
-    def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        mock_mode: bool = False,
+        enable_cache: bool = True
+    ):
         self.api_key = api_key or get_config().get_env("APOLLO_API_KEY", "")
         self.mock_mode = mock_mode or get_config().get_workflow_config().enable_mock_mode
         self.base_url = "https://api.apollo.io/v1"
         self.timeout = 30
         self.max_retries = 3
+        self._session = requests.Session()
+        self._session.mount(
+            self.base_url,
+            HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=self.max_retries,
+                    backoff_factor=0.5,
+                    backoff_jitter=0.5,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    respect_retry_after_header=True,
+                    allowed_methods=["GET", "POST"]
+                )
+            )
+        )
+        self._session.headers.update(self._headers())
+        self._rate_limiter = get_rate_limiter("apollo")
+        self._search_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS) if enable_cache else None
+        )
+        self._cache_lock = threading.Lock()
+        self._search_people_prefix: Optional[bytes] = None
         
         if not self.api_key and not self.mock_mode:
             logger.warning("Apollo API key not found, falling back to mock mode")
@@ -40,31 +94,56 @@ class ApolloAPI:
         Returns:
             List of contact dictionaries
         """
+        key = self._search_key(company_name, titles, limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(key, self._search_people_uncached(company_name, titles, limit))
+    
+    def _cache_get(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached contacts for a search key, if any"""
+        if self._search_cache is None:
+            return None
+        
+        with self._cache_lock:
+            return self._search_cache.get(key)
+    
+    def _cache_put(self, key: tuple, contacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Store a search result and return it"""
+        # Don't pin failed or empty searches for the whole TTL
+        if self._search_cache is not None and contacts:
+            with self._cache_lock:
+                self._search_cache[key] = contacts
+        return contacts
+    
+    def _search_people_uncached(
+        self,
+        company_name: Optional[str],
+        titles: Optional[List[str]],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Run a people search against the API, bypassing the cache"""
         if self.mock_mode:
             return self._mock_search_people(company_name, titles, limit)
         
         endpoint = f"{self.base_url}/mixed_people/search"
         
-        payload = {
-            "q_keywords": company_name if company_name else "",
-            "person_titles": titles or ["VP of Sales", "Head of Sales", "Sales Director"],
-            "per_page": limit,
-            "api_key": self.api_key
-        }
+        body = self._search_people_body(company_name, titles, limit)
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             response = self._make_request_with_retry(
                 "POST",
                 endpoint,
-                json=payload
+                data=body
             )
             
-            response_time = time.time() - start_time
+            response_time = (time.monotonic_ns() - start_ns) / 1e9
             logger.log_api_call("Apollo", endpoint, "success", response_time)
             
-            data = response.json()
+            data = fastjson.loads(response.content)
             contacts = data.get("people", [])
             
             logger.info(f"Found {len(contacts)} contacts from Apollo")
@@ -74,6 +153,179 @@ class ApolloAPI:
             logger.error(f"Apollo people search failed: {e}")
             return []
     
+    def search_people_bulk(
+        self,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for contacts for many companies in as few requests as possible
+        
+        Args:
+            queries: List of search_people keyword arguments
+            
+        Returns:
+            Contact lists in the same order as queries
+        """
+        unique, keys = self._dedupe_queries(queries)
+        
+        by_key: Dict[tuple, List[Dict[str, Any]]] = {}
+        if self._search_cache is not None:
+            with self._cache_lock:
+                for key in unique:
+                    cached = self._search_cache.get(key)
+                    if cached is not None:
+                        by_key[key] = cached
+        
+        misses = {key: query for key, query in unique.items() if key not in by_key}
+        if misses:
+            if self.mock_mode:
+                fetched = self._mock_search_people_bulk(list(misses.values()))
+            else:
+                fetched = self._search_people_bulk_unique(list(misses.values()))
+            
+            fetched_by_key = dict(zip(misses, fetched))
+            if self._search_cache is not None:
+                with self._cache_lock:
+                    for key, contacts in fetched_by_key.items():
+                        # Don't pin failed or empty searches for the whole TTL
+                        if contacts:
+                            self._search_cache[key] = contacts
+            by_key.update(fetched_by_key)
+        
+        return [list(by_key[key]) for key in keys]
+    
+    def _dedupe_queries(
+        self,
+        queries: List[Dict[str, Any]]
+    ) -> Tuple[Dict[tuple, Dict[str, Any]], List[tuple]]:
+        """Map each distinct search key to its first query, plus the key of every query in order"""
+        # Several leads often share a company; search each distinct query once
+        unique: Dict[tuple, Dict[str, Any]] = {}
+        keys = []
+        for query in queries:
+            key = self._search_key(query.get("company_name"), query.get("titles"), query.get("limit", 10))
+            unique.setdefault(key, query)
+            keys.append(key)
+        
+        if len(unique) < len(queries):
+            logger.info(f"Deduplicated {len(queries)} Apollo searches to {len(unique)}")
+        return unique, keys
+    
+    def _search_people_bulk_unique(
+        self,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Send already-deduplicated searches through the bulk endpoint"""
+        endpoint = f"{self.base_url}/mixed_people/bulk_search"
+        results: List[List[Dict[str, Any]]] = []
+        
+        query_iter = iter(queries)
+        while chunk := list(islice(query_iter, BULK_CHUNK_SIZE)):
+            payload = {
+                "searches": [
+                    {
+                        "q_keywords": query.get("company_name") or "",
+                        "person_titles": query.get("titles") or DEFAULT_PERSON_TITLES,
+                        "per_page": query.get("limit", 10)
+                    }
+                    for query in chunk
+                ],
+                "api_key": self.api_key
+            }
+            
+            start_ns = time.monotonic_ns()
+            
+            try:
+                response = self._make_request_with_retry(
+                    "POST",
+                    endpoint,
+                    json=payload
+                )
+                
+                response_time = (time.monotonic_ns() - start_ns) / 1e9
+                logger.log_api_call("Apollo", endpoint, "success", response_time)
+                
+                chunk_results = [
+                    item.get("people", []) for item in fastjson.loads(response.content).get("results", [])
+                ]
+                # Keep results aligned with queries even if the response is short
+                chunk_results.extend([] for _ in range(len(chunk) - len(chunk_results)))
+                results.extend(chunk_results[:len(chunk)])
+                
+            except Exception as e:
+                logger.error(f"Apollo bulk people search failed: {e}")
+                results.extend([] for _ in chunk)
+        
+        logger.info(f"Found {sum(map(len, results))} contacts from Apollo bulk search")
+        return results
+    
+    async def asearch_people(
+        self,
+        company_name: Optional[str] = None,
+        titles: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Async variant of search_people, sharing its cache"""
+        key = self._search_key(company_name, titles, limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(key, await self._asearch_people_uncached(company_name, titles, limit))
+    
+    async def _asearch_people_uncached(
+        self,
+        company_name: Optional[str],
+        titles: Optional[List[str]],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Async variant of _search_people_uncached"""
+        if self.mock_mode:
+            return self._mock_search_people(company_name, titles, limit)
+        
+        endpoint = f"{self.base_url}/mixed_people/search"
+        
+        body = self._search_people_body(company_name, titles, limit)
+        
+        start_ns = time.monotonic_ns()
+        
+        try:
+            response = await self._arequest_with_retry(
+                "POST",
+                endpoint,
+                content=body
+            )
+            
+            response_time = (time.monotonic_ns() - start_ns) / 1e9
+            logger.log_api_call("Apollo", endpoint, "success", response_time)
+            
+            contacts = fastjson.loads(response.content).get("people", [])
+            
+            logger.info(f"Found {len(contacts)} contacts from Apollo")
+            return contacts
+            
+        except Exception as e:
+            logger.error(f"Apollo people search failed: {e}")
+            return []
+    
+    async def batch_search_people(
+        self,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several people searches concurrently
+        
+        Args:
+            queries: List of search_people keyword arguments
+            
+        Returns:
+            Contact lists in the same order as queries
+        """
+        unique, keys = self._dedupe_queries(queries)
+        results = await asyncio.gather(*(self.asearch_people(**query) for query in unique.values()))
+        by_key = dict(zip(unique, results))
+        return [list(by_key[key]) for key in keys]
+    
     def mixed_search(
         self,
         filters: Dict[str, Any],
@@ -107,7 +359,7 @@ class ApolloAPI:
                 json=payload
             )
             
-            return response.json()
+            return fastjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Apollo mixed search failed: {e}")
@@ -153,7 +405,7 @@ class ApolloAPI:
             )
             
             logger.info(f"Email sent to {email_address}")
-            return response.json()
+            return fastjson.loads(response.content)
             
         except Exception as e:
             logger.error(f" Apollo email send failed to {email_address}: {e}")
@@ -186,7 +438,7 @@ class ApolloAPI:
                 params=params
             )
             
-            return response.json()
+            return fastjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Apollo tracking failed for campaign {campaign_id}: {e}")
@@ -198,25 +450,64 @@ class ApolloAPI:
         url: str,
         **kwargs
     ) -> requests.Response:
-        """Make HTTP request with retry logic"""
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.request(
+        """Make HTTP request; retries and backoff are handled by the session adapter"""
+        try:
+            with self._rate_limiter:
+                response = self._session.request(
                     method,
                     url,
                     timeout=self.timeout,
                     **kwargs
                 )
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                
-                wait_time = 2 ** attempt
-                logger.warning(f" Retry {attempt + 1}/{self.max_retries} after {wait_time}s")
-                time.sleep(wait_time)
+        except requests.exceptions.RetryError as e:
+            logger.warning(f"Giving up on {url} after {self.max_retries} retries: {e}")
+            raise
+        
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _search_key(company_name: Optional[str], titles: Optional[List[str]], limit: int) -> tuple:
+        """Hashable identity of a people search, shared by the cache and bulk dedupe"""
+        return ((company_name or "").lower(), tuple(sorted(titles or ())), limit)
+    
+    def _search_people_body(
+        self,
+        company_name: Optional[str],
+        titles: Optional[List[str]],
+        limit: int
+    ) -> bytes:
+        """
+        Encode a people search request body
+        
+        The default titles and API key never change, so they are encoded once
+        into a prefix and only the per-call fields are spliced in.
+        """
+        if titles:
+            return orjson.dumps({
+                "q_keywords": company_name or "",
+                "person_titles": titles,
+                "per_page": limit,
+                "api_key": self.api_key
+            })
+        
+        if self._search_people_prefix is None:
+            # Strip the closing brace so the variable fields can be appended
+            self._search_people_prefix = orjson.dumps({
+                "person_titles": DEFAULT_PERSON_TITLES,
+                "api_key": self.api_key
+            })[:-1]
+        
+        return b"".join((
+            self._search_people_prefix,
+            b',"q_keywords":', orjson.dumps(company_name or ""),
+            b',"per_page":', str(int(limit)).encode(),
+            b"}"
+        ))
+    
+    def _headers(self) -> Dict[str, str]:
+        """Request headers for the Apollo API"""
+        return {"Content-Type": "application/json"}
     
     def _mock_search_people(
         self,
@@ -227,22 +518,41 @@ class ApolloAPI:
         """Generate mock contact search results"""
         logger.info(f"MOCK MODE: Generating {limit} mock contacts for {company_name}")
         
-        mock_contacts = [
-            {
-                "id": f"apollo_{i}",
-                "first_name": f"John",
-                "last_name": f"Doe{i}",
-                "name": f"John Doe{i}",
-                "title": "VP of Sales" if i % 2 == 0 else "Head of Marketing",
-                "email": f"john.doe{i}@{company_name.lower().replace(' ', '')}.com" if company_name else f"john.doe{i}@example.com",
-                "linkedin_url": f"https://linkedin.com/in/johndoe{i}",
-                "company_name": company_name or f"Company {i}",
-                "phone": f"+1 (555) {100 + i:03d}-{1000 + i:04d}"
-            }
-            for i in range(1, min(limit, 5) + 1)
+        return [
+            contact.to_dict()
+            for contact in islice(self._iter_mock_contacts(company_name), min(limit, 5))
         ]
+    
+    def _iter_mock_contacts(self, company_name: Optional[str]) -> Iterator[Contact]:
+        """Lazily yield mock contacts, one record at a time"""
+        email_domain = f"{company_name.lower().replace(' ', '')}.com" if company_name else "example.com"
         
-        return mock_contacts
+        for i in count(1):
+            yield Contact(
+                id=f"apollo_{i}",
+                first_name="John",
+                last_name=f"Doe{i}",
+                name=f"John Doe{i}",
+                title="VP of Sales" if i % 2 == 0 else "Head of Marketing",
+                email=f"john.doe{i}@{email_domain}",
+                linkedin_url=f"https://linkedin.com/in/johndoe{i}",
+                company_name=company_name or f"Company {i}",
+                phone=f"+1 (555) {100 + i:03d}-{1000 + i:04d}"
+            )
+    
+    def _mock_search_people_bulk(
+        self,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Generate mock bulk contact search results"""
+        return [
+            self._mock_search_people(
+                query.get("company_name"),
+                query.get("titles"),
+                query.get("limit", 10)
+            )
+            for query in queries
+        ]
     
     def _mock_mixed_search(
         self,
@@ -254,16 +564,18 @@ class ApolloAPI:
         
         return {
             "people": self._mock_search_people(None, None, limit // 2),
-            "organizations": [
-                {
-                    "name": f"Company {i}",
-                    "domain": f"company{i}.com",
-                    "industry": "SaaS"
-                }
-                for i in range(1, (limit // 2) + 1)
-            ]
+            "organizations": list(islice(self._iter_mock_organizations(), limit // 2))
         }
     
+    def _iter_mock_organizations(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield mock organizations, one dict at a time"""
+        for i in count(1):
+            yield {
+                "name": f"Company {i}",
+                "domain": f"company{i}.com",
+                "industry": "SaaS"
+            }
+    
     def _mock_send_email(
         self,
         email_address: str,
@@ -276,8 +588,8 @@ class ApolloAPI:
             "status": "sent",
             "email": email_address,
             "subject": subject,
-            "message_id": f"msg_{int(time.time())}",
-            "sent_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            "message_id": f"msg_{uuid.uuid4().hex[:12]}",
+            "sent_at": timestamp_now()
         }
     
     def _mock_track_activity(
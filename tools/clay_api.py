@@ -1,23 +1,70 @@
 """
 Clay API Tool - Company and contact data enrichment
 """
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from cachetools import TTLCache
+from itertools import count, islice
+from typing import Any, Dict, Iterator, List, Optional
+from tools.records import Company
+from utils import fastjson
 from utils.logger import get_logger
 from utils.config_loader import get_config
+from utils.rate_limiter import get_rate_limiter
+from utils.http_client import HTTPClientMixin
 
 logger = get_logger("clay_api")
 
-class ClayAPI:
+# Maximum number of domains sent in one bulk request
+BULK_CHUNK_SIZE = 100
+
+# Statuses worth retrying; any other 4xx fails immediately
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Enrichment results are stable enough to reuse for a day
+CACHE_MAXSIZE = 10_000
+CACHE_TTL_SECONDS = 24 * 3600
+
+class ClayAPI(HTTPClientMixin):
     """Clay API wrapper for company search and enrichment"""
     
-    def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        mock_mode: bool = False,
+        enable_cache: bool = True
+    ):
         self.api_key = api_key or get_config().get_env("CLAY_API_KEY", "")
         self.mock_mode = mock_mode or get_config().get_workflow_config().enable_mock_mode
         self.base_url = "https://api.clay.com"
         self.timeout = 30
         self.max_retries = 3
+        self._session = requests.Session()
+        self._session.mount(
+            self.base_url,
+            HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=self.max_retries,
+                    backoff_factor=0.5,
+                    backoff_jitter=0.5,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    respect_retry_after_header=True,
+                    allowed_methods=["GET", "POST"]
+                )
+            )
+        )
+        self._session.headers.update(self._headers())
+        self._rate_limiter = get_rate_limiter("clay")
+        self._enrich_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS) if enable_cache else None
+        )
+        self._cache_lock = threading.Lock()
         
         if not self.api_key and not self.mock_mode:
             logger.warning(" Clay API key not found, falling back to mock mode")
@@ -48,25 +95,19 @@ class ClayAPI:
             "limit": limit
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             response = self._make_request_with_retry(
                 "POST", 
                 endpoint, 
-                json=payload, 
-                headers=headers
+                json=payload
             )
             
-            response_time = time.time() - start_time
+            response_time = (time.monotonic_ns() - start_ns) / 1e9
             logger.log_api_call("Clay", endpoint, "success", response_time)
             
-            data = response.json()
+            data = fastjson.loads(response.content)
             companies = data.get("results", [])
             
             logger.info(f"Found {len(companies)} companies from Clay")
@@ -86,57 +127,229 @@ class ClayAPI:
         Returns:
             Enriched company data
         """
+        cached = self._cache_get(domain)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(domain, self._fetch_company(domain))
+    
+    def _cache_get(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Return the cached enrichment for a domain, if any"""
+        if self._enrich_cache is None:
+            return None
+        
+        with self._cache_lock:
+            return self._enrich_cache.get(domain.lower())
+    
+    def _cache_put(self, domain: str, company: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an enrichment and return it"""
+        # Don't pin failed or empty lookups for the whole TTL
+        if self._enrich_cache is not None and company:
+            with self._cache_lock:
+                self._enrich_cache[domain.lower()] = company
+        return company
+    
+    def _fetch_company(self, domain: str) -> Dict[str, Any]:
+        """Enrich one domain through the single-company endpoint, bypassing the cache"""
         if self.mock_mode:
-            return self._mock_enrich_company(domain)
+            return self._mock_company(domain)
         
         endpoint = f"{self.base_url}/v1/companies/enrich"
         
-        payload = {"domain": domain}
+        try:
+            response = self._make_request_with_retry(
+                "POST",
+                endpoint,
+                json={"domain": domain}
+            )
+            
+            return fastjson.loads(response.content)
+            
+        except Exception as e:
+            logger.error(f"Clay enrich failed for {domain}: {e}")
+            return {}
+    
+    def enrich_companies_bulk(self, domains: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich many company domains in as few requests as possible
+        
+        Args:
+            domains: Company domains
+            
+        Returns:
+            Enriched company data keyed by domain
+        """
+        # Several leads often share a domain; look each one up once
+        domains = list(dict.fromkeys(domains))
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+        if self._enrich_cache is None:
+            return self._fetch_companies_bulk(domains)
+        
+        enriched: Dict[str, Dict[str, Any]] = {}
+        misses: List[str] = []
+        
+        with self._cache_lock:
+            for domain in domains:
+                cached = self._enrich_cache.get(domain.lower())
+                if cached is not None:
+                    enriched[domain] = cached
+                else:
+                    misses.append(domain)
+        
+        if misses:
+            fetched = self._fetch_companies_bulk(misses)
+            with self._cache_lock:
+                for domain, company in fetched.items():
+                    # Don't pin failed or empty lookups for the whole TTL
+                    if company:
+                        self._enrich_cache[domain.lower()] = company
+            enriched.update(fetched)
+        
+        return enriched
+    
+    def _fetch_companies_bulk(self, domains: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Enrich domains through the bulk endpoint, bypassing the cache"""
+        if self.mock_mode:
+            return self._mock_enrich_companies(domains)
+        
+        endpoint = f"{self.base_url}/v1/companies/bulk_enrich"
+        enriched: Dict[str, Dict[str, Any]] = {}
+        
+        domain_iter = iter(domains)
+        while chunk := list(islice(domain_iter, BULK_CHUNK_SIZE)):
+            # Key results by the domain we asked for, not the API's canonical form
+            requested = {domain.lower(): domain for domain in chunk}
+            start_ns = time.monotonic_ns()
+            
+            try:
+                response = self._make_request_with_retry(
+                    "POST",
+                    endpoint,
+                    json={"domains": chunk}
+                )
+                
+                response_time = (time.monotonic_ns() - start_ns) / 1e9
+                logger.log_api_call("Clay", endpoint, "success", response_time)
+                
+                for company in fastjson.loads(response.content).get("results", []):
+                    domain = requested.get(str(company.get("domain", "")).lower())
+                    if domain is not None:
+                        enriched[domain] = company
+                
+            except Exception as e:
+                logger.error(f"Clay bulk enrich failed for {len(chunk)} domains: {e}")
+        
+        return enriched
+    
+    async def asearch_companies(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Async variant of search_companies"""
+        if self.mock_mode:
+            return self._mock_search_companies(filters, limit)
+        
+        endpoint = f"{self.base_url}/v1/companies/search"
+        
+        payload = {
+            "filters": filters,
+            "limit": limit
         }
         
+        start_ns = time.monotonic_ns()
+        
         try:
-            response = self._make_request_with_retry(
+            response = await self._arequest_with_retry(
                 "POST",
                 endpoint,
-                json=payload,
-                headers=headers
+                json=payload
             )
             
-            return response.json()
+            response_time = (time.monotonic_ns() - start_ns) / 1e9
+            logger.log_api_call("Clay", endpoint, "success", response_time)
+            
+            companies = fastjson.loads(response.content).get("results", [])
+            
+            logger.info(f"Found {len(companies)} companies from Clay")
+            return companies
+            
+        except Exception as e:
+            logger.error(f"Clay API search failed: {e}")
+            return []
+    
+    async def aenrich_company(self, domain: str) -> Dict[str, Any]:
+        """Async variant of enrich_company, sharing its cache"""
+        cached = self._cache_get(domain)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(domain, await self._afetch_company(domain))
+    
+    async def _afetch_company(self, domain: str) -> Dict[str, Any]:
+        """Async variant of _fetch_company"""
+        if self.mock_mode:
+            return self._mock_company(domain)
+        
+        endpoint = f"{self.base_url}/v1/companies/enrich"
+        
+        try:
+            response = await self._arequest_with_retry(
+                "POST",
+                endpoint,
+                json={"domain": domain}
+            )
+            
+            return fastjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Clay enrich failed for {domain}: {e}")
             return {}
     
+    async def batch_enrich(self, domains: List[str]) -> List[Dict[str, Any]]:
+        """
+        Enrich several company domains concurrently
+        
+        Args:
+            domains: Company domains
+            
+        Returns:
+            Enriched company data in the same order as domains
+        """
+        # Look each domain up once, however many times (or in whatever case) it repeats
+        unique = list(dict.fromkeys(domain.lower() for domain in domains))
+        results = await asyncio.gather(*(self.aenrich_company(domain) for domain in unique))
+        by_domain = dict(zip(unique, results))
+        return [by_domain[domain.lower()] for domain in domains]
+    
+    def _headers(self) -> Dict[str, str]:
+        """Request headers for the Clay API"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
     def _make_request_with_retry(
         self, 
         method: str, 
         url: str, 
         **kwargs
     ) -> requests.Response:
-        """Make HTTP request with retry logic"""
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.request(
-                    method, 
-                    url, 
+        """Make HTTP request; retries and backoff are handled by the session adapter"""
+        try:
+            with self._rate_limiter:
+                response = self._session.request(
+                    method,
+                    url,
                     timeout=self.timeout,
                     **kwargs
                 )
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                
-                wait_time = 2 ** attempt
-                logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {wait_time}s")
-                time.sleep(wait_time)
+        except requests.exceptions.RetryError as e:
+            logger.warning(f"Giving up on {url} after {self.max_retries} retries: {e}")
+            raise
+        
+        response.raise_for_status()
+        return response
     
     def _mock_search_companies(
         self, 
@@ -146,27 +359,34 @@ class ClayAPI:
         """Generate mock company search results"""
         logger.info(f"MOCK MODE: Generating {limit} mock companies")
         
-        mock_companies = [
-            {
-                "company_name": f"TechCorp {i}",
-                "domain": f"techcorp{i}.com",
-                "industry": "SaaS",
-                "employee_count": 250 + (i * 50),
-                "revenue": 50000000 + (i * 10000000),
-                "location": "San Francisco, CA",
-                "description": f"Leading SaaS company #{i} in workflow automation",
-                "technologies": ["Python", "React", "AWS", "PostgreSQL"],
-                "growth_signal": "recent_funding" if i % 2 == 0 else "hiring_for_sales"
-            }
-            for i in range(1, min(limit, 10) + 1)
+        return [
+            company.to_dict()
+            for company in islice(self._iter_mock_companies(), min(limit, 10))
         ]
-        
-        return mock_companies
     
-    def _mock_enrich_company(self, domain: str) -> Dict[str, Any]:
-        """Generate mock enriched company data"""
-        logger.info(f" MOCK MODE: Enriching {domain}")
+    def _iter_mock_companies(self) -> Iterator[Company]:
+        """Lazily yield mock companies, one record at a time"""
+        for i in count(1):
+            yield Company(
+                company_name=f"TechCorp {i}",
+                domain=f"techcorp{i}.com",
+                industry="SaaS",
+                employee_count=250 + (i * 50),
+                revenue=50000000 + (i * 10000000),
+                location="San Francisco, CA",
+                description=f"Leading SaaS company #{i} in workflow automation",
+                technologies=("Python", "React", "AWS", "PostgreSQL"),
+                growth_signal="recent_funding" if i % 2 == 0 else "hiring_for_sales"
+            )
+    
+    def _mock_enrich_companies(self, domains: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Generate mock enriched company data keyed by domain"""
+        logger.info(f" MOCK MODE: Enriching {len(domains)} domains")
         
+        return {domain: self._mock_company(domain) for domain in domains}
+    
+    def _mock_company(self, domain: str) -> Dict[str, Any]:
+        """Generate one mock enriched company record"""
         return {
             "domain": domain,
             "company_name": domain.split('.')[0].title(),
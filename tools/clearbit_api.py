@@ -1,24 +1,112 @@
 """
 Clearbit API Tool - Company and person enrichment
 """
+import asyncio
+import copy
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
-from typing import Any, Dict, Optional
+from cachetools import TTLCache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from utils.logger import get_logger
 from utils.config_loader import get_config
+from utils.http_encoding import ACCEPT_ENCODING
+from utils.async_runner import run_sync
+from utils.http_client import HTTPClientMixin
 
 logger = get_logger("clearbit_api")
 
-class ClearbitAPI:
+# Company profiles rarely change; person records (title, employer) drift faster
+CACHE_MAXSIZE = 5_000
+COMPANY_CACHE_TTL_SECONDS = 24 * 3600
+PERSON_CACHE_TTL_SECONDS = 4 * 3600
+
+# ETags outlive the response cache so expired entries can be revalidated with a 304
+ETAG_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Statuses worth retrying; any other 4xx (e.g. 404 for an unknown domain) fails immediately
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Mock-mode payload constants, merged with per-lead fields; nested values are
+# deep-copied per call so cached results never share objects with the templates
+_MOCK_COMPANY_TEMPLATE = {
+    "category": {
+        "industry": "Technology",
+        "sector": "Software"
+    },
+    "tags": ["SaaS", "B2B", "Enterprise"],
+    "tech": ["Python", "React", "AWS", "PostgreSQL", "Redis"],
+    "employees": 450,
+    "employeesRange": "250-500",
+    "foundedYear": 2015,
+    "location": "San Francisco, CA, USA",
+    "metrics": {
+        "raised": 45000000,
+        "annualRevenue": 75000000,
+        "estimatedAnnualRevenue": "$50M-$100M"
+    },
+    "type": "private"
+}
+_MOCK_COMPANY_DESCRIPTION = "{name} is a leading technology company specializing in innovative solutions."
+_MOCK_COMPANY_LINKEDIN = "company/{handle}"
+
+_MOCK_PERSON_TEMPLATE = {
+    "location": "San Francisco, CA, USA"
+}
+_MOCK_EMPLOYMENT_TEMPLATE = {
+    "title": "VP of Sales",
+    "role": "sales",
+    "seniority": "executive"
+}
+_MOCK_PERSON_LINKEDIN = "in/{handle}"
+_MOCK_PERSON_BIO = "{first_name} is an experienced sales leader with expertise in B2B SaaS."
+_MOCK_PERSON_AVATAR = "https://i.pravatar.cc/150?u={email}"
+
+# Shared by all clients for bulk lookups; threads start on first use
+BULK_MAX_WORKERS = 16
+_bulk_pool = ThreadPoolExecutor(max_workers=BULK_MAX_WORKERS, thread_name_prefix="clearbit")
+
+class ClearbitAPI(HTTPClientMixin):
     """Clearbit API wrapper for data enrichment"""
     
-    def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
+    ASYNC_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+    # httpx treats 3xx as errors too; a 304 answers a conditional request
+    PASSTHROUGH_STATUS_CODES = (304,)
+    RETRY_BASE_DELAY = 1.0
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        mock_mode: bool = False,
+        enable_cache: bool = True
+    ):
         self.api_key = api_key or get_config().get_env("CLEARBIT_API_KEY", "")
         self.mock_mode = mock_mode or get_config().get_workflow_config().enable_mock_mode
         self.base_url = "https://company.clearbit.com/v2"
         self.person_url = "https://person.clearbit.com/v2"
         self.timeout = 30
         self.max_retries = 3
+        self._session = requests.Session()
+        # Retries stay in _make_request_with_retry; the adapter only pools connections
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self._session.mount("https://company.clearbit.com", adapter)
+        self._session.mount("https://person.clearbit.com", adapter)
+        self._session.headers.update(self._headers())
+        self._company_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=COMPANY_CACHE_TTL_SECONDS) if enable_cache else None
+        )
+        self._person_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=PERSON_CACHE_TTL_SECONDS) if enable_cache else None
+        )
+        self._company_etags: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=ETAG_CACHE_TTL_SECONDS)
+        self._cache_lock = threading.Lock()
+        # Lookups currently on the wire, so concurrent callers for one key share a request
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
         
         if not self.api_key and not self.mock_mode:
             logger.warning(" Clearbit API key not found, falling back to mock mode")
@@ -34,6 +122,10 @@ class ClearbitAPI:
         Returns:
             Enriched company data
         """
+        return self._lookup(self._company_cache, "company", domain, self._fetch_company)
+    
+    def _fetch_company(self, domain: str) -> Dict[str, Any]:
+        """Look up a company through the API, bypassing the cache"""
         if self.mock_mode:
             return self._mock_enrich_company(domain)
         
@@ -41,10 +133,6 @@ class ClearbitAPI:
         
         params = {"domain": domain}
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
         start_time = time.time()
         
         try:
@@ -52,13 +140,17 @@ class ClearbitAPI:
                 "GET",
                 endpoint,
                 params=params,
-                headers=headers
+                headers=self._conditional_headers(domain)
             )
             
             response_time = time.time() - start_time
             logger.log_api_call("Clearbit", endpoint, "success", response_time)
+            logger.debug(
+                "Clearbit response: %d bytes decoded, Content-Encoding=%s",
+                len(response.content), response.headers.get("Content-Encoding", "identity")
+            )
             
-            data = response.json()
+            data = self._company_from_response(domain, response)
             logger.info(f"Enriched company data for {domain}")
             return data
             
@@ -76,6 +168,10 @@ class ClearbitAPI:
         Returns:
             Enriched person data
         """
+        return self._lookup(self._person_cache, "person", email, self._fetch_person)
+    
+    def _fetch_person(self, email: str) -> Dict[str, Any]:
+        """Look up a person through the API, bypassing the cache"""
         if self.mock_mode:
             return self._mock_enrich_person(email)
         
@@ -83,16 +179,11 @@ class ClearbitAPI:
         
         params = {"email": email}
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
         try:
             response = self._make_request_with_retry(
                 "GET",
                 endpoint,
-                params=params,
-                headers=headers
+                params=params
             )
             
             data = response.json()
@@ -103,6 +194,111 @@ class ClearbitAPI:
             logger.error(f"Clearbit person enrichment failed for {email}: {e}")
             return {}
     
+    async def aenrich_company(self, domain: str) -> Dict[str, Any]:
+        """Async variant of enrich_company"""
+        key = domain.strip().lower()
+        cached = self._cache_get(self._company_cache, key)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(self._company_cache, key, await self._afetch_company(domain))
+    
+    async def _afetch_company(self, domain: str) -> Dict[str, Any]:
+        """Async company lookup, bypassing the cache"""
+        if self.mock_mode:
+            return self._mock_enrich_company(domain)
+        
+        endpoint = f"{self.base_url}/companies/find"
+        
+        start_time = time.time()
+        
+        try:
+            response = await self._arequest_with_retry(
+                "GET",
+                endpoint,
+                params={"domain": domain},
+                headers=self._conditional_headers(domain)
+            )
+            
+            response_time = time.time() - start_time
+            logger.log_api_call("Clearbit", endpoint, "success", response_time)
+            logger.debug(
+                "Clearbit response: %d bytes decoded, Content-Encoding=%s",
+                len(response.content), response.headers.get("Content-Encoding", "identity")
+            )
+            
+            data = self._company_from_response(domain, response)
+            logger.info(f"Enriched company data for {domain}")
+            return data
+            
+        except Exception as e:
+            logger.error(f"Clearbit company enrichment failed for {domain}: {e}")
+            return {}
+    
+    async def aenrich_person(self, email: str) -> Dict[str, Any]:
+        """Async variant of enrich_person"""
+        key = email.strip().lower()
+        cached = self._cache_get(self._person_cache, key)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(self._person_cache, key, await self._afetch_person(email))
+    
+    async def _afetch_person(self, email: str) -> Dict[str, Any]:
+        """Async person lookup, bypassing the cache"""
+        if self.mock_mode:
+            return self._mock_enrich_person(email)
+        
+        endpoint = f"{self.person_url}/people/find"
+        
+        try:
+            response = await self._arequest_with_retry(
+                "GET",
+                endpoint,
+                params={"email": email}
+            )
+            
+            data = response.json()
+            logger.info(f"Enriched person data for {email}")
+            return data
+            
+        except Exception as e:
+            logger.error(f"Clearbit person enrichment failed for {email}: {e}")
+            return {}
+    
+    def enrich_companies_bulk(self, domains: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich many company domains concurrently on the shared thread pool
+        
+        Args:
+            domains: Company domains
+            
+        Returns:
+            Enriched company data keyed by domain
+        """
+        return self._bulk(self.enrich_company, domains)
+    
+    def enrich_people_bulk(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich many people concurrently on the shared thread pool
+        
+        Args:
+            emails: Email addresses
+            
+        Returns:
+            Enriched person data keyed by email
+        """
+        return self._bulk(self.enrich_person, emails)
+    
+    def _bulk(self, lookup, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run lookup for each distinct key on the pool and collect results by key"""
+        futures = {_bulk_pool.submit(lookup, key): key for key in dict.fromkeys(keys)}
+        results = {}
+        for future in as_completed(futures):
+            # Lookups log and return {} on failure, so result() doesn't raise
+            results[futures[future]] = future.result()
+        return results
+    
     def combined_enrichment(self, email: str, domain: str) -> Dict[str, Any]:
         """
         Enrich both person and company data
@@ -114,12 +310,126 @@ class ClearbitAPI:
         Returns:
             Combined enrichment data
         """
-        person_data = self.enrich_person(email)
-        company_data = self.enrich_company(domain)
+        async def main() -> Dict[str, Any]:
+            try:
+                return await self.acombined_enrichment(email, domain)
+            finally:
+                # The async client is bound to this loop, which asyncio.run is about to close
+                await self.aclose()
+        
+        return run_sync(main, "acombined_enrichment()")
+    
+    async def acombined_enrichment(self, email: str, domain: str) -> Dict[str, Any]:
+        """Async variant of combined_enrichment; both lookups run concurrently"""
+        person_data, company_data = await asyncio.gather(
+            self.aenrich_person(email),
+            self.aenrich_company(domain),
+            return_exceptions=True
+        )
+        
+        return {
+            "person": person_data if isinstance(person_data, dict) else {},
+            "company": company_data if isinstance(company_data, dict) else {}
+        }
+    
+    def _conditional_headers(self, domain: str) -> Dict[str, str]:
+        """If-None-Match header for a domain whose ETag we know"""
+        with self._cache_lock:
+            validator = self._company_etags.get(domain.strip().lower())
+        return {"If-None-Match": validator[0]} if validator else {}
+    
+    def _company_from_response(self, domain: str, response) -> Dict[str, Any]:
+        """Decode a company lookup, serving 304 Not Modified from the stored copy"""
+        key = domain.strip().lower()
+        
+        if response.status_code == 304:
+            with self._cache_lock:
+                validator = self._company_etags.get(key)
+            if validator:
+                logger.debug(f"Clearbit 304 Not Modified: {domain}")
+                return validator[1]
+            return {}
+        
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag and data:
+            with self._cache_lock:
+                self._company_etags[key] = (etag, data)
+        return data
+    
+    def _lookup(
+        self,
+        cache: Optional[TTLCache],
+        kind: str,
+        value: str,
+        fetch: Callable[[str], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Serve a lookup from the cache, or fetch it once however many threads ask
+        
+        Fan-out steps enrich one lead per task, so leads sharing a company
+        arrive concurrently; the first caller fetches and the rest wait on
+        its result instead of racing past the cache.
+        """
+        key = value.strip().lower()
+        cached = self._cache_get(cache, key)
+        if cached is not None:
+            return cached
+        
+        flight_key = (kind, key)
+        with self._cache_lock:
+            # Another caller may have filled the cache since the miss above
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                return cached
+            future = self._inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = self._inflight[flight_key] = Future()
+        
+        if not leader:
+            logger.debug(f"Clearbit lookup already in flight: {key}")
+            return future.result()
+        
+        try:
+            data = self._cache_put(cache, key, fetch(value))
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(flight_key, None)
+    
+    def _cache_get(self, cache: Optional[TTLCache], key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached enrichment, counting the hit or miss"""
+        if cache is None:
+            return None
         
+        with self._cache_lock:
+            cached = cache.get(key)
+            if cached is None:
+                self.cache_misses += 1
+            else:
+                self.cache_hits += 1
+        
+        logger.debug(f"Clearbit cache {'HIT' if cached is not None else 'MISS'}: {key}")
+        return cached
+    
+    def _cache_put(self, cache: Optional[TTLCache], key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an enrichment and return it"""
+        # Don't pin failed or empty lookups for the whole TTL
+        if cache is not None and data:
+            with self._cache_lock:
+                cache[key] = data
+        return data
+    
+    def _headers(self) -> Dict[str, str]:
+        """Request headers for the Clearbit API"""
         return {
-            "person": person_data,
-            "company": company_data
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept-Encoding": ACCEPT_ENCODING
         }
     
     def _make_request_with_retry(
@@ -131,7 +441,7 @@ class ClearbitAPI:
         """Make HTTP request with retry logic"""
         for attempt in range(self.max_retries):
             try:
-                response = requests.request(
+                response = self._session.request(
                     method,
                     url,
                     timeout=self.timeout,
@@ -140,12 +450,14 @@ class ClearbitAPI:
                 response.raise_for_status()
                 return response
                 
-            except requests.exceptions.RequestException as e:
-                if attempt == self.max_retries - 1:
+            except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # Connection errors and timeouts have no response and are always retried
+                response = e.response if isinstance(e, requests.exceptions.HTTPError) else None
+                if attempt == self.max_retries - 1 or (response is not None and response.status_code not in RETRY_STATUS_CODES):
                     raise
                 
-                wait_time = 2 ** attempt
-                logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {wait_time}s")
+                wait_time = self._retry_delay(attempt, response)
+                logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {wait_time:.2f}s")
                 time.sleep(wait_time)
     
     def _mock_enrich_company(self, domain: str) -> Dict[str, Any]:
@@ -153,37 +465,16 @@ class ClearbitAPI:
         logger.info(f"MOCK MODE: Enriching company {domain}")
         
         company_name = domain.split('.')[0].title()
+        handle = company_name.lower()
+        fields = {"name": company_name, "handle": handle}
         
-        return {
+        return copy.deepcopy(_MOCK_COMPANY_TEMPLATE) | {
             "name": company_name,
             "domain": domain,
-            "description": f"{company_name} is a leading technology company specializing in innovative solutions.",
-            "category": {
-                "industry": "Technology",
-                "sector": "Software"
-            },
-            "tags": ["SaaS", "B2B", "Enterprise"],
-            "tech": ["Python", "React", "AWS", "PostgreSQL", "Redis"],
-            "employees": 450,
-            "employeesRange": "250-500",
-            "foundedYear": 2015,
-            "location": "San Francisco, CA, USA",
-            "metrics": {
-                "raised": 45000000,
-                "annualRevenue": 75000000,
-                "estimatedAnnualRevenue": "$50M-$100M"
-            },
-            "linkedin": {
-                "handle": f"company/{company_name.lower()}"
-            },
-            "twitter": {
-                "handle": company_name.lower(),
-                "followers": 12500
-            },
-            "facebook": {
-                "handle": company_name.lower()
-            },
-            "type": "private"
+            "description": _MOCK_COMPANY_DESCRIPTION.format_map(fields),
+            "linkedin": {"handle": _MOCK_COMPANY_LINKEDIN.format_map(fields)},
+            "twitter": {"handle": handle, "followers": 12500},
+            "facebook": {"handle": handle}
         }
     
     def _mock_enrich_person(self, email: str) -> Dict[str, Any]:
@@ -194,27 +485,19 @@ class ClearbitAPI:
         first_name = name_parts[0].title() if len(name_parts) > 0 else "John"
         last_name = name_parts[1].title() if len(name_parts) > 1 else "Doe"
         
-        return {
+        handle = f"{first_name.lower()}{last_name.lower()}"
+        fields = {"first_name": first_name, "handle": handle, "email": email}
+        
+        return _MOCK_PERSON_TEMPLATE | {
             "name": {
                 "fullName": f"{first_name} {last_name}",
                 "givenName": first_name,
                 "familyName": last_name
             },
             "email": email,
-            "location": "San Francisco, CA, USA",
-            "employment": {
-                "name": email.split('@')[1].split('.')[0].title(),
-                "title": "VP of Sales",
-                "role": "sales",
-                "seniority": "executive"
-            },
-            "linkedin": {
-                "handle": f"in/{first_name.lower()}{last_name.lower()}"
-            },
-            "twitter": {
-                "handle": f"{first_name.lower()}{last_name.lower()}",
-                "followers": 3500
-            },
-            "bio": f"{first_name} is an experienced sales leader with expertise in B2B SaaS.",
-            "avatar": f"https://i.pravatar.cc/150?u={email}"
+            "employment": _MOCK_EMPLOYMENT_TEMPLATE | {"name": email.split('@')[1].split('.')[0].title()},
+            "linkedin": {"handle": _MOCK_PERSON_LINKEDIN.format_map(fields)},
+            "twitter": {"handle": handle, "followers": 3500},
+            "bio": _MOCK_PERSON_BIO.format_map(fields),
+            "avatar": _MOCK_PERSON_AVATAR.format_map(fields)
         }
\ No newline at end of file
@@ -1,26 +1,118 @@
 """
 Gemini API Tool - AI-powered content generation
 """
-import google.generativeai as genai
-from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from cachetools import TTLCache
+from concurrent.futures import Future
+from string import Template
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from utils import fastjson
 from utils.logger import get_logger
+from utils.request_batcher import RequestBatcher
+from utils.rate_limiter import get_rate_limiter
 from utils.config_loader import get_config
 
 logger = get_logger("gemini_api")
 
+# Fallback email templates, compiled once and rendered per lead
+_FALLBACK_SUBJECT = Template("Quick question about ${company}'s workflow")
+_FALLBACK_BODY = Template("""Hi ${contact},
+
+I noticed ${company}'s recent growth and thought you might be interested in ${value_prop}.
+
+Would you be open to a quick 15-minute chat next week to explore if this could help your team?
+
+Best,
+[Your Name]""")
+
+# Personalized email prompt; identical inputs always give a byte-identical prompt
+_EMAIL_PROMPT = Template("""
+You are an expert SDR writing a personalized outreach email.
+
+CONTEXT:
+- Contact Name: ${contact}
+- Company: ${company}
+- Role: ${role}
+- Growth Signal: ${signal}
+- Value Proposition: ${value_prop}
+- Tone: ${tone}
+
+INSTRUCTIONS:
+1. Write a compelling subject line (max 60 characters)
+2. Write a personalized email body (max 150 words)
+3. Reference their growth signal naturally
+4. Clearly state the value proposition
+5. Include a soft call-to-action
+6. Keep it conversational and authentic
+
+FORMAT YOUR RESPONSE EXACTLY AS:
+SUBJECT: [your subject line here]
+
+BODY:
+[your email body here]
+
+Do not include any other text or formatting.
+""")
+
+# Captures subject and body of a generated email in one pass
+_EMAIL_RE = re.compile(r"SUBJECT:\s*(.+?)\s*BODY:\s*(.+?)\s*\Z", re.S)
+
+# Lines mentioning any of these (as substrings, e.g. "recommended") are recommendations
+_REC_RE = re.compile(r"recommend|suggest|should|consider", re.I)
+
+# Email prompts are coalesced into concurrent batches of this size
+EMAIL_BATCH_SIZE = 8
+EMAIL_BATCH_LINGER_MS = 50
+
+# Longest a caller waits for a generated email before using the fallback template
+EMAIL_GENERATION_TIMEOUT = 60.0
+
+# Response cache: near-deterministic generations are reused for a day, others
+# for an hour; high-temperature output is meant to vary and is never cached
+CACHE_MAXSIZE = 2_000
+CACHE_TTL_SECONDS = 3600
+DETERMINISTIC_CACHE_TTL_SECONDS = 24 * 3600
+DETERMINISTIC_TEMPERATURE = 0.1
+MAX_CACHED_TEMPERATURE = 0.7
+
 class GeminiAPI:
     """Google Gemini API wrapper for AI content generation"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        enable_cache: bool = True
+    ):
         self.api_key = api_key or get_config().get_env("GEMINI_API_KEY", "")
         self.model_name = model or get_config().get_env("GEMINI_MODEL", "gemini-2.5-flash")
         
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY is required and not found")
         
-        # Configure Gemini
+        # Configure Gemini; the SDK is heavy, so it is only imported once a client is built
+        import google.generativeai as genai
+        self._genai = genai
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(self.model_name)
+        self._batcher = RequestBatcher(
+            self._generate_batch,
+            max_batch_size=EMAIL_BATCH_SIZE,
+            linger_ms=EMAIL_BATCH_LINGER_MS
+        )
+        # Batches are dispatched without waiting on each other, so every call takes a token
+        self._rate_limiter = get_rate_limiter("gemini")
+        self._resp_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS) if enable_cache else None
+        )
+        self._deterministic_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=DETERMINISTIC_CACHE_TTL_SECONDS) if enable_cache else None
+        )
+        self._cache_lock = threading.Lock()
         
         logger.info(f" Gemini API initialized with model: {self.model_name}")
     
@@ -41,25 +133,70 @@ class GeminiAPI:
         Returns:
             Generated text
         """
+        cache = self._cache_for(temperature)
+        if cache is not None:
+            key = hashlib.sha256(
+                f"{self.model_name}|{temperature}|{max_tokens}|{prompt}".encode()
+            ).hexdigest()
+            with self._cache_lock:
+                cached = cache.get(key)
+            if cached is not None:
+                logger.debug("Gemini response cache hit")
+                return cached
+        
         try:
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens
-            )
-            
-            response = self.model.generate_content(
-                prompt,
-                generation_config=generation_config
-            )
-            
-            generated_text = response.text
+            # Chunks are joined as they arrive rather than after the full response lands
+            generated_text = "".join(self.stream_content(prompt, temperature, max_tokens))
             logger.info(f" Generated {len(generated_text)} characters")
+            
+            if cache is not None and generated_text:
+                with self._cache_lock:
+                    cache[key] = generated_text
             return generated_text
             
         except Exception as e:
             logger.error(f"Gemini content generation failed: {e}")
             return ""
     
+    def stream_content(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> Iterator[str]:
+        """
+        Generate content using Gemini, yielding text as it is produced
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            
+        Yields:
+            Text chunks in order
+        """
+        generation_config = self._genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens
+        )
+        
+        response = self.model.generate_content(
+            prompt,
+            generation_config=generation_config,
+            stream=True
+        )
+        
+        for chunk in response:
+            # The closing chunk may carry only a finish reason and no text
+            if chunk.parts:
+                yield chunk.text
+    
+    def _cache_for(self, temperature: float) -> Optional[TTLCache]:
+        """Pick the response cache for a sampling temperature, or None to skip caching"""
+        if self._resp_cache is None or temperature > MAX_CACHED_TEMPERATURE:
+            return None
+        return self._deterministic_cache if temperature <= DETERMINISTIC_TEMPERATURE else self._resp_cache
+    
     def generate_personalized_email(
         self,
         lead_data: Dict[str, Any],
@@ -77,60 +214,123 @@ class GeminiAPI:
         Returns:
             Dict with subject and body
         """
+        return self._parse_email(self._submit_email(lead_data, value_proposition, tone), lead_data, value_proposition)
+    
+    def generate_personalized_emails(
+        self,
+        leads: List[Dict[str, Any]],
+        value_proposition: str,
+        tone: str = "friendly_professional"
+    ) -> List[Dict[str, str]]:
+        """
+        Generate personalized outreach emails for many leads concurrently
+        
+        Args:
+            leads: Lead information dicts, as for generate_personalized_email
+            value_proposition: Product/service value prop
+            tone: Email tone
+            
+        Returns:
+            Subject/body dicts in the same order as leads
+        """
+        # Submit everything first so the batcher can group the prompts
+        futures = [self._submit_email(lead_data, value_proposition, tone) for lead_data in leads]
+        # One deadline for the whole set, so N slow emails don't wait N timeouts
+        deadline = time.monotonic() + EMAIL_GENERATION_TIMEOUT
+        return [
+            self._parse_email(future, lead_data, value_proposition, timeout=max(0.0, deadline - time.monotonic()))
+            for future, lead_data in zip(futures, leads)
+        ]
+    
+    def _submit_email(
+        self,
+        lead_data: Dict[str, Any],
+        value_proposition: str,
+        tone: str
+    ) -> Future:
+        """Queue the email prompt for a lead on the batcher"""
         contact_name = lead_data.get("contact_name", "there")
         company_name = lead_data.get("company", "your company")
         role = lead_data.get("role", "")
         signal = lead_data.get("signal", "")
         
-        prompt = f"""
-You are an expert SDR writing a personalized outreach email.
-
-CONTEXT:
-- Contact Name: {contact_name}
-- Company: {company_name}
-- Role: {role}
-- Growth Signal: {signal}
-- Value Proposition: {value_proposition}
-- Tone: {tone}
-
-INSTRUCTIONS:
-1. Write a compelling subject line (max 60 characters)
-2. Write a personalized email body (max 150 words)
-3. Reference their growth signal naturally
-4. Clearly state the value proposition
-5. Include a soft call-to-action
-6. Keep it conversational and authentic
-
-FORMAT YOUR RESPONSE EXACTLY AS:
-SUBJECT: [your subject line here]
-
-BODY:
-[your email body here]
-
-Do not include any other text or formatting.
-"""
+        prompt = _EMAIL_PROMPT.substitute(
+            contact=contact_name,
+            company=company_name,
+            role=role,
+            signal=signal,
+            value_prop=value_proposition,
+            tone=tone
+        )
+        
+        return self._batcher.submit((0.8, 1000), prompt)
+    
+    def _parse_email(
+        self,
+        future: Future,
+        lead_data: Dict[str, Any],
+        value_proposition: str,
+        timeout: float = EMAIL_GENERATION_TIMEOUT
+    ) -> Dict[str, str]:
+        """Wait up to timeout for a batched generation and split it into subject and body"""
+        contact_name = lead_data.get("contact_name", "there")
+        company_name = lead_data.get("company", "your company")
         
         try:
-            response = self.generate_content(prompt, temperature=0.8)
+            response = future.result(timeout=timeout)
             
             # Parse response
-            parts = response.split("BODY:")
-            if len(parts) == 2:
-                subject_part = parts[0].replace("SUBJECT:", "").strip()
-                body_part = parts[1].strip()
-                
+            match = _EMAIL_RE.search(response)
+            if match:
                 return {
-                    "subject": subject_part,
-                    "body": body_part
+                    "subject": match.group(1),
+                    "body": match.group(2)
                 }
             else:
                 logger.warning("Failed to parse Gemini response, using fallback")
                 return self._fallback_email(contact_name, company_name, value_proposition)
+        
+        except TimeoutError:
+            # The batch may still finish later; its result is simply dropped
+            logger.error(f"Email generation for {company_name} timed out, using fallback")
+            return self._fallback_email(contact_name, company_name, value_proposition)
                 
         except Exception as e:
             logger.error(f"Email generation failed: {e}")
             return self._fallback_email(contact_name, company_name, value_proposition)
     
+    async def _generate_batch(self, key: Tuple[float, int], prompts: List[str]) -> List[Any]:
+        """Run one batch of prompts sharing a generation config concurrently"""
+        temperature, max_tokens = key
+        generation_config = self._genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens
+        )
+        
+        async def generate(prompt: str):
+            async with self._rate_limiter:
+                return await self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    request_options={"timeout": EMAIL_GENERATION_TIMEOUT}
+                )
+        
+        responses = await asyncio.gather(
+            *(generate(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
+        
+        results = []
+        for response in responses:
+            try:
+                results.append(response if isinstance(response, BaseException) else response.text)
+            except Exception as e:
+                # .text raises when the candidate was blocked or empty
+                results.append(e)
+        
+        logger.info(f" Generated batch of {len(prompts)} emails")
+        return results
+    
     def analyze_campaign_performance(
         self,
         metrics: Dict[str, Any],
@@ -178,10 +378,9 @@ FORMAT AS JSON:
             response = self.generate_content(prompt, temperature=0.5)
             
             # Try to parse as JSON (Gemini sometimes returns valid JSON)
-            import json
             try:
-                return json.loads(response)
-            except:
+                return fastjson.loads(response)
+            except ValueError:
                 # Fallback: extract key insights
                 return {
                     "assessment": "Needs improvement",
@@ -203,25 +402,14 @@ FORMAT AS JSON:
         value_prop: str
     ) -> Dict[str, str]:
         """Fallback email template"""
+        context = {"contact": contact_name, "company": company_name, "value_prop": value_prop}
         return {
-            "subject": f"Quick question about {company_name}'s workflow",
-            "body": f"""Hi {contact_name},
-
-I noticed {company_name}'s recent growth and thought you might be interested in {value_prop}.
-
-Would you be open to a quick 15-minute chat next week to explore if this could help your team?
-
-Best,
-[Your Name]"""
+            "subject": _FALLBACK_SUBJECT.safe_substitute(context),
+            "body": _FALLBACK_BODY.safe_substitute(context)
         }
     
     def _extract_recommendations(self, text: str) -> List[str]:
         """Extract recommendations from unstructured text"""
-        lines = text.split('\n')
-        recommendations = []
-        
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['recommend', 'suggest', 'should', 'consider']):
-                recommendations.append(line.strip())
+        recommendations = [line.strip() for line in text.split('\n') if _REC_RE.search(line)]
         
         return recommendations[:3] if recommendations else ["Improve subject lines", "Refine targeting", "Test new messaging"]
\ No newline at end of file
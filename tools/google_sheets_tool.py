@@ -1,30 +1,84 @@
 """
 Google Sheets API Tool - Write recommendations for human approval
 """
+import importlib.util
+from operator import itemgetter
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from utils.logger import get_logger
 from utils.config_loader import get_config
+from utils.http_encoding import ACCEPT_ENCODING
 
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
+# gspread and google-auth are imported on first real use; mock runs never load them
+GSPREAD_AVAILABLE = (
+    importlib.util.find_spec("gspread") is not None
+    and importlib.util.find_spec("google.oauth2") is not None
+)
 
 logger = get_logger("google_sheets")
 
+# Queued approval-status changes are written in one batch_update once this
+# many are pending, or after the flush interval, whichever comes first
+STATUS_BATCH_SIZE = 50
+STATUS_FLUSH_INTERVAL = 0.2
+
+# Sheet column holding approval_status, and the last data column
+APPROVAL_STATUS_COLUMN = "I"
+APPROVAL_STATUS_COLUMN_INDEX = 9
+LAST_COLUMN = "I"
+
+# Recommendation fields written to columns C-F, with blanks for missing keys
+_REC_FIELDS = ('category', 'recommendation', 'expected_impact', 'priority')
+_REC_DEFAULTS = dict.fromkeys(_REC_FIELDS, '')
+_rec_getter = itemgetter(*_REC_FIELDS)
+
+# Header row of the recommendations sheet, prebuilt as Sheets API cell data
+_SHEET_HEADERS = (
+    "Timestamp",
+    "Campaign ID",
+    "Category",
+    "Recommendation",
+    "Expected Impact",
+    "Priority",
+    "Open Rate",
+    "Reply Rate",
+    "Approval Status"
+)
+_HEADER_ROW_DATA = {"values": [{"userEnteredValue": {"stringValue": header}} for header in _SHEET_HEADERS]}
+_HEADER_FORMAT = {
+    "textFormat": {"bold": True},
+    "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}
+}
+
+# Reopen the worksheet periodically in case it was renamed or replaced
+SHEET_HANDLE_TTL_SECONDS = 600
+
 class GoogleSheetsTool:
     """Google Sheets API wrapper for recommendation tracking"""
     
-    def __init__(self, credentials_file: Optional[str] = None, mock_mode: bool = False):
+    def __init__(
+        self,
+        credentials_file: Optional[str] = None,
+        mock_mode: bool = False,
+        flush_interval: float = STATUS_FLUSH_INTERVAL,
+        max_batch_size: int = STATUS_BATCH_SIZE
+    ):
         self.credentials_file = credentials_file or get_config().get_env(
             "GOOGLE_SHEETS_CREDENTIALS_FILE", "credentials.json"
         )
         self.sheet_id = get_config().get_env("GOOGLE_SHEET_ID", "")
         self.mock_mode = mock_mode or get_config().get_workflow_config().enable_mock_mode
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._pending_updates: List[Tuple[int, str]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self.workbook = None
+        self.sheet = None
+        self._sheet_opened_at = 0.0
+        self._header_row: Optional[List[str]] = None
         
         if not GSPREAD_AVAILABLE:
             logger.warning("  gspread library not installed, using mock mode")
@@ -38,10 +92,12 @@ class GoogleSheetsTool:
                 self.mock_mode = True
         else:
             self.client = None
-            self.sheet = None
     
     def _initialize_client(self):
         """Initialize Google Sheets client"""
+        import gspread
+        from google.oauth2.service_account import Credentials
+        
         scopes = [
             'https://www.googleapis.com/auth/spreadsheets',
             'https://www.googleapis.com/auth/drive'
@@ -53,8 +109,23 @@ class GoogleSheetsTool:
         )
         
         self.client = gspread.authorize(creds)
+        # Ask Google for compressed payloads on the client's underlying session
+        self.client.http_client.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
         logger.info(" Google Sheets client initialized")
     
+    def _open_sheet(self):
+        """Open the workbook and first worksheet, remembering when"""
+        self.workbook = self.client.open_by_key(self.sheet_id)
+        self.sheet = self.workbook.sheet1
+        self._sheet_opened_at = time.monotonic()
+        self._header_row = None
+    
+    def _worksheet(self):
+        """Worksheet handle, opened on first use and reopened once older than SHEET_HANDLE_TTL_SECONDS"""
+        if self.sheet is None or time.monotonic() - self._sheet_opened_at > SHEET_HANDLE_TTL_SECONDS:
+            self._open_sheet()
+        return self.sheet
+    
     def write_recommendations(
         self,
         recommendations: List[Dict[str, Any]],
@@ -76,28 +147,21 @@ class GoogleSheetsTool:
             return self._mock_write_recommendations(recommendations, campaign_id, metrics)
         
         try:
-            sheet = self.client.open_by_key(self.sheet_id).sheet1
+            sheet = self._worksheet()
             
             # Prepare data rows
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            rows = []
-            for rec in recommendations:
-                row = [
-                    timestamp,
-                    campaign_id,
-                    rec.get('category', ''),
-                    rec.get('recommendation', ''),
-                    rec.get('expected_impact', ''),
-                    rec.get('priority', ''),
-                    metrics.get('open_rate', 0),
-                    metrics.get('reply_rate', 0),
-                    'pending'  # approval_status
-                ]
-                rows.append(row)
+            open_rate = metrics.get('open_rate', 0)
+            reply_rate = metrics.get('reply_rate', 0)
+            
+            rows = [
+                [timestamp, campaign_id, *_rec_getter(_REC_DEFAULTS | rec), open_rate, reply_rate, 'pending']  # approval_status
+                for rec in recommendations
+            ]
             
-            # Append rows
-            sheet.append_rows(rows)
+            # Append rows; RAW skips server-side parsing of the values
+            sheet.append_rows(rows, value_input_option="RAW")
             
             logger.info(f" Wrote {len(recommendations)} recommendations to Google Sheets")
             
@@ -121,14 +185,25 @@ class GoogleSheetsTool:
             return self._mock_get_approved()
         
         try:
-            sheet = self.client.open_by_key(self.sheet_id).sheet1
-            records = sheet.get_all_records()
+            sheet = self._worksheet()
             
-            approved = [
-                rec for rec in records
-                if rec.get('approval_status', '').lower() == 'approved'
+            # Read only the status column, then fetch just the approved rows
+            statuses = sheet.col_values(APPROVAL_STATUS_COLUMN_INDEX)
+            approved_rows = [
+                row for row, status in enumerate(statuses[1:], start=2)
+                if status.lower() == 'approved'
             ]
             
+            if not approved_rows:
+                approved = []
+            else:
+                if self._header_row is None:
+                    self._header_row = sheet.row_values(1)
+                headers = self._header_row
+                
+                ranges = sheet.batch_get([f"A{row}:{LAST_COLUMN}{row}" for row in approved_rows])
+                approved = [self._row_to_record(headers, values[0] if values else []) for values in ranges]
+            
             logger.info(f" Retrieved {len(approved)} approved recommendations")
             return approved
             
@@ -136,6 +211,14 @@ class GoogleSheetsTool:
             logger.error(f" Failed to read from Google Sheets: {e}")
             return []
     
+    @staticmethod
+    def _row_to_record(headers: List[str], row: List[str]) -> Dict[str, Any]:
+        """Map a row to a dict shaped like get_all_records (short rows padded, numbers parsed)"""
+        from gspread.utils import numericise_all
+        
+        padded = row + [""] * (len(headers) - len(row))
+        return dict(zip(headers, numericise_all(padded)))
+    
     def update_approval_status(
         self,
         campaign_id: str,
@@ -156,20 +239,49 @@ class GoogleSheetsTool:
         if self.mock_mode:
             return self._mock_update_status(campaign_id, recommendation_index, status)
         
+        result = self.update_approval_statuses([(recommendation_index, status)])
+        if result["status"] != "success":
+            return result
+        
+        return {
+            "status": "success",
+            "campaign_id": campaign_id,
+            "recommendation_index": recommendation_index,
+            "new_status": status
+        }
+    
+    def update_approval_statuses(self, updates: List[Tuple[int, str]]) -> Dict[str, Any]:
+        """
+        Update approval status of several recommendations in one request
+        
+        Args:
+            updates: (row index, new status) pairs
+            
+        Returns:
+            Update status
+        """
+        if not updates:
+            return {"status": "success", "rows_updated": 0}
+        
+        if self.mock_mode:
+            for recommendation_index, status in updates:
+                logger.info(f" MOCK MODE: Updating recommendation {recommendation_index} to '{status}'")
+            return {"status": "success", "rows_updated": len(updates), "mock": True}
+        
         try:
-            sheet = self.client.open_by_key(self.sheet_id).sheet1
+            sheet = self._worksheet()
             
-            # Find the row with matching campaign_id
-            # Note: This is a simple implementation; production would need better row tracking
-            sheet.update_cell(recommendation_index, 9, status)  # Column 9 is approval_status
+            # Note: rows are addressed by index; production would need better row tracking
+            sheet.batch_update([
+                {"range": f"{APPROVAL_STATUS_COLUMN}{row}", "values": [[status]]}
+                for row, status in updates
+            ])
             
-            logger.info(f" Updated approval status to '{status}' for recommendation {recommendation_index}")
+            logger.info(f" Updated approval status for {len(updates)} recommendations")
             
             return {
                 "status": "success",
-                "campaign_id": campaign_id,
-                "recommendation_index": recommendation_index,
-                "new_status": status
+                "rows_updated": len(updates)
             }
             
         except Exception as e:
@@ -179,6 +291,39 @@ class GoogleSheetsTool:
                 "error": str(e)
             }
     
+    def queue_approval_status(self, recommendation_index: int, status: str):
+        """
+        Buffer a status change to be written with others in a single batch
+        
+        The buffer is flushed when it reaches max_batch_size or flush_interval
+        seconds after the first queued change. Call flush_approval_statuses()
+        to write immediately.
+        
+        Args:
+            recommendation_index: Row index of the recommendation
+            status: New status (approved/rejected)
+        """
+        with self._pending_lock:
+            self._pending_updates.append((recommendation_index, status))
+            flush_now = len(self._pending_updates) >= self.max_batch_size
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush_approval_statuses)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if flush_now:
+            self.flush_approval_statuses()
+    
+    def flush_approval_statuses(self) -> Dict[str, Any]:
+        """Write all buffered status changes now"""
+        with self._pending_lock:
+            updates, self._pending_updates = self._pending_updates, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        
+        return self.update_approval_statuses(updates)
+    
     def create_recommendations_sheet(self) -> Dict[str, Any]:
         """
         Create a new sheet with proper headers for recommendations
@@ -190,34 +335,43 @@ class GoogleSheetsTool:
             logger.info("🎭 MOCK MODE: Would create recommendations sheet")
             return {"status": "success", "mock": True}
         
+        from gspread.exceptions import SpreadsheetNotFound
+        
         try:
             # Try to open existing sheet or create new
             try:
                 workbook = self.client.open("AI Agent Recommendations")
-            except gspread.exceptions.SpreadsheetNotFound:
+            except SpreadsheetNotFound:
                 workbook = self.client.create("AI Agent Recommendations")
             
             sheet = workbook.sheet1
             
-            # Set headers
-            headers = [
-                "Timestamp",
-                "Campaign ID",
-                "Category",
-                "Recommendation",
-                "Expected Impact",
-                "Priority",
-                "Open Rate",
-                "Reply Rate",
-                "Approval Status"
-            ]
-            
-            sheet.update('A1:I1', [headers])
+            header_range = {
+                "sheetId": sheet.id,
+                "startRowIndex": 0,
+                "endRowIndex": 1,
+                "startColumnIndex": 0,
+                "endColumnIndex": len(_SHEET_HEADERS)
+            }
             
-            # Format headers (bold)
-            sheet.format('A1:I1', {
-                "textFormat": {"bold": True},
-                "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}
+            # Set and format headers (bold) in a single batchUpdate round trip
+            workbook.batch_update({
+                "requests": [
+                    {
+                        "updateCells": {
+                            "range": header_range,
+                            "rows": [_HEADER_ROW_DATA],
+                            "fields": "userEnteredValue"
+                        }
+                    },
+                    {
+                        "repeatCell": {
+                            "range": header_range,
+                            "cell": {"userEnteredFormat": _HEADER_FORMAT},
+                            "fields": "userEnteredFormat(textFormat,backgroundColor)"
+                        }
+                    }
+                ]
             })
             
             logger.info(f" Created/updated recommendations sheet: {workbook.id}")
@@ -0,0 +1,42 @@
+"""
+Compact record types for contact and company data returned by the API tools
+"""
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Tuple
+
+@dataclass(slots=True, frozen=True)
+class Contact:
+    """A person returned by a contact search"""
+    id: str
+    first_name: str
+    last_name: str
+    name: str
+    title: str
+    email: str
+    linkedin_url: str
+    company_name: str
+    phone: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict shape agents consume"""
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class Company:
+    """A company returned by a company search"""
+    company_name: str
+    domain: str
+    industry: str
+    employee_count: int
+    revenue: int
+    location: str
+    description: str
+    technologies: Tuple[str, ...]
+    growth_signal: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict shape agents consume"""
+        data = asdict(self)
+        data["technologies"] = list(self.technologies)
+        return data
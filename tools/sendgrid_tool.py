@@ -1,13 +1,25 @@
 """
 SendGrid API Tool - Email sending service
 """
+import asyncio
+import random
+import importlib.util
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from utils.logger import get_logger
 from utils.config_loader import get_config
+from utils.clock import timestamp_now
+from utils.http_client import HTTPClientMixin
 
+# Only the mail helpers are used, to build request bodies; sends go through _get_session()
 try:
-    from sendgrid import SendGridAPIClient
     from sendgrid.helpers.mail import Mail, Email, To, Content
     SENDGRID_AVAILABLE = True
 except ImportError:
@@ -15,14 +27,104 @@ except ImportError:
 
 logger = get_logger("sendgrid_api")
 
-class SendGridTool:
-    """SendGrid API wrapper for email sending"""
+# Throttling and transient server errors are retried with exponential backoff
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_SEND_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Concurrent sends per process; kept small so batches don't exhaust the API
+MAX_SEND_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+MAIL_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# v3 mail/send accepts at most this many personalizations per request
+MAX_PERSONALIZATIONS = 1000
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One keep-alive connection pool per process
+_session_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+
+
+# Per-thread generators so concurrent mock sends don't share one Random
+_thread_rng = threading.local()
+
+
+def _rng() -> random.Random:
+    """Random instance owned by the calling thread"""
+    rng = getattr(_thread_rng, "rng", None)
+    if rng is None:
+        rng = _thread_rng.rng = random.Random()
+    return rng
+
+
+def _get_session() -> requests.Session:
+    """
+    Shared pooled session for mail sends
+    
+    SendGridAPIClient's python_http_client opens a fresh urllib connection
+    (and TLS handshake) per request, so sends use this keep-alive pool and
+    the client itself is never constructed.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.mount("https://api.sendgrid.com", HTTPAdapter(
+                pool_maxsize=16,
+                pool_block=False,
+                # read/other stay at 0: once the request went out it may have been
+                # delivered, so only connect errors and retryable statuses are retried
+                max_retries=Retry(
+                    total=MAX_SEND_ATTEMPTS - 1,
+                    read=0,
+                    other=0,
+                    backoff_factor=RETRY_BASE_DELAY,
+                    backoff_max=RETRY_MAX_DELAY,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    respect_retry_after_header=True,
+                    allowed_methods=["POST"]
+                )
+            ))
+            _session = session
+        return _session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared send pool, created on first batch"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_SEND_WORKERS, thread_name_prefix="sendgrid")
+        return _executor
+
+class SendGridTool(HTTPClientMixin):
+    """
+    SendGrid API wrapper for email sending
+    
+    Instances are cheap: all sends reuse one process-wide connection pool,
+    following the one-client-per-application rule. Don't build sessions per call.
+    """
+    
+    HTTP2 = H2_AVAILABLE
+    ASYNC_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    # Same backoff as the sync session's urllib3 Retry
+    RETRY_BASE_DELAY = RETRY_BASE_DELAY
+    RETRY_MAX_DELAY = RETRY_MAX_DELAY
     
     def __init__(self, api_key: Optional[str] = None, mock_mode: bool = False):
         self.api_key = api_key or get_config().get_env("SENDGRID_API_KEY", "")
         self.mock_mode = mock_mode or get_config().get_workflow_config().enable_mock_mode
         self.from_email = get_config().get_env("SENDGRID_FROM_EMAIL", "noreply@example.com")
         self.from_name = get_config().get_env("SENDGRID_FROM_NAME", "AI Agent")
+        self.timeout = 30
+        self.max_retries = MAX_SEND_ATTEMPTS
         
         if not SENDGRID_AVAILABLE:
             logger.warning("SendGrid library not installed, using mock mode")
@@ -31,11 +133,6 @@ class SendGridTool:
         if not self.api_key and not self.mock_mode:
             logger.warning("SendGrid API key not found, falling back to mock mode")
             self.mock_mode = True
-        
-        if not self.mock_mode and SENDGRID_AVAILABLE:
-            self.client = SendGridAPIClient(self.api_key)
-        else:
-            self.client = None
     
     def send_email(
         self,
@@ -68,14 +165,20 @@ class SendGridTool:
             )
             
             start_time = time.time()
-            response = self.client.send(message)
+            response = _get_session().post(
+                MAIL_SEND_URL,
+                json=message.get(),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=30
+            )
+            response.raise_for_status()
             response_time = time.time() - start_time
             
             logger.log_api_call("SendGrid", "send_email", "success", response_time)
             
-            message_id = response.headers.get('X-Message-Id', f"sg_{int(time.time())}")
+            message_id = response.headers.get('X-Message-Id') or f"sg_{uuid.uuid4().hex[:12]}"
             
-            logger.info(f"Email sent to {to_email} - Message ID: {message_id}")
+            logger.info("Email sent to %s - Message ID: %s", to_email, message_id)
             
             return {
                 "status": "sent",
@@ -83,18 +186,84 @@ class SendGridTool:
                 "subject": subject,
                 "message_id": message_id,
                 "status_code": response.status_code,
-                "sent_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                "sent_at": timestamp_now()
             }
             
         except Exception as e:
-            logger.error(f"SendGrid email send failed to {to_email}: {e}")
+            logger.error("SendGrid email send failed to %s: %s", to_email, e)
             return {
                 "status": "failed",
                 "email": to_email,
                 "error": str(e),
-                "sent_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                "sent_at": timestamp_now()
             }
     
+    def send_broadcast(
+        self,
+        recipients: List[Dict[str, str]],
+        subject: str,
+        body: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Send the same email to many recipients with one API call per 1000
+        
+        Each recipient gets its own personalization, so nobody sees the
+        other addresses.
+        
+        Args:
+            recipients: List of dicts with to_email and optional to_name
+            subject: Email subject
+            body: Email body (plain text)
+            
+        Returns:
+            List of send statuses, in the same order as recipients
+        """
+        if self.mock_mode:
+            return [self._mock_send_email(r.get('to_email'), subject, body) for r in recipients]
+        
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(recipients), MAX_PERSONALIZATIONS):
+            chunk = recipients[start:start + MAX_PERSONALIZATIONS]
+            try:
+                start_time = time.time()
+                response = _get_session().post(
+                    MAIL_SEND_URL,
+                    json=self._broadcast_body(chunk, subject, body),
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    timeout=30
+                )
+                response.raise_for_status()
+                response_time = time.time() - start_time
+                
+                logger.log_api_call("SendGrid", "send_broadcast", "success", response_time)
+                
+                message_id = response.headers.get('X-Message-Id') or f"sg_{uuid.uuid4().hex[:12]}"
+                
+                logger.info("Broadcast sent to %s recipients - Message ID: %s", len(chunk), message_id)
+                
+                sent_at = timestamp_now()
+                results.extend(
+                    {
+                        "status": "sent",
+                        "email": r.get('to_email'),
+                        "subject": subject,
+                        "message_id": message_id,
+                        "status_code": response.status_code,
+                        "sent_at": sent_at
+                    }
+                    for r in chunk
+                )
+                
+            except Exception as e:
+                logger.error("SendGrid broadcast to %s recipients failed: %s", len(chunk), e)
+                sent_at = timestamp_now()
+                results.extend(
+                    {"status": "failed", "email": r.get('to_email'), "error": str(e), "sent_at": sent_at}
+                    for r in chunk
+                )
+        
+        return results
+    
     def send_batch(
         self,
         emails: List[Dict[str, str]],
@@ -103,6 +272,9 @@ class SendGridTool:
         """
         Send multiple emails with rate limiting
         
+        Emails sharing a subject and body are sent together through
+        send_broadcast; the rest go out one request each.
+        
         Args:
             emails: List of email dicts with to_email, subject, body
             delay_seconds: Delay between sends
@@ -110,25 +282,188 @@ class SendGridTool:
         Returns:
             List of send statuses
         """
-        results = []
+        groups: Dict[tuple, List[int]] = {}
+        for i, email_data in enumerate(emails):
+            groups.setdefault((email_data.get('subject'), email_data.get('body')), []).append(i)
         
-        for idx, email_data in enumerate(emails, 1):
-            logger.info(f"Sending email {idx}/{len(emails)}...")
+        # Sends run concurrently, but start no closer together than delay_seconds
+        slot_lock = threading.Lock()
+        next_slot = time.monotonic()
+        
+        def wait_for_slot():
+            nonlocal next_slot
+            with slot_lock:
+                slot = max(next_slot, time.monotonic())
+                next_slot = slot + delay_seconds
+            wait = slot - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+        
+        def send(indices: List[int]) -> List[Dict[str, Any]]:
+            wait_for_slot()
+            first = emails[indices[0]]
+            
+            if len(indices) > 1:
+                logger.info("Sending broadcast to %s recipients...", len(indices))
+                return self.send_broadcast(
+                    [emails[i] for i in indices],
+                    subject=first.get('subject'),
+                    body=first.get('body')
+                )
             
-            result = self.send_email(
-                to_email=email_data.get('to_email'),
-                subject=email_data.get('subject'),
-                body=email_data.get('body'),
-                to_name=email_data.get('to_name')
+            logger.info("Sending email %s/%s...", indices[0] + 1, len(emails))
+            return [self.send_email(
+                to_email=first.get('to_email'),
+                subject=first.get('subject'),
+                body=first.get('body'),
+                to_name=first.get('to_name')
+            )]
+        
+        executor = _get_executor()
+        futures = [(indices, executor.submit(send, indices)) for indices in groups.values()]
+        
+        # Scattered back by index so results line up with emails
+        results: List[Optional[Dict[str, Any]]] = [None] * len(emails)
+        for indices, future in futures:
+            for i, result in zip(indices, future.result()):
+                results[i] = result
+        return results
+    
+    async def send_email_async(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        to_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of send_email, posting to the v3 API on the event loop"""
+        if self.mock_mode:
+            return self._mock_send_email(to_email, subject, body)
+        
+        try:
+            start_time = time.time()
+            response = await self._arequest_with_retry(
+                "POST",
+                MAIL_SEND_URL,
+                json=self._mail_body(to_email, subject, body, to_name)
             )
+            response_time = time.time() - start_time
+            
+            logger.log_api_call("SendGrid", "send_email", "success", response_time)
+            
+            message_id = response.headers.get('X-Message-Id') or f"sg_{uuid.uuid4().hex[:12]}"
+            
+            logger.info("Email sent to %s - Message ID: %s", to_email, message_id)
             
-            results.append(result)
+            return {
+                "status": "sent",
+                "email": to_email,
+                "subject": subject,
+                "message_id": message_id,
+                "status_code": response.status_code,
+                "sent_at": timestamp_now()
+            }
             
-            # Rate limiting
-            if idx < len(emails):
-                time.sleep(delay_seconds)
+        except Exception as e:
+            logger.error("SendGrid email send failed to %s: %s", to_email, e)
+            return {
+                "status": "failed",
+                "email": to_email,
+                "error": str(e),
+                "sent_at": timestamp_now()
+            }
+    
+    async def send_batch_async(
+        self,
+        emails: List[Dict[str, str]],
+        delay_seconds: float = 0.5,
+        max_concurrency: int = MAX_SEND_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """
+        Send multiple emails concurrently on the event loop
         
-        return results
+        Args:
+            emails: List of email dicts with to_email, subject, body
+            delay_seconds: Minimum spacing between send starts
+            max_concurrency: Maximum simultaneous sends
+            
+        Returns:
+            List of send statuses, in the same order as emails
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        next_slot = time.monotonic()
+        
+        async def send(email_data: Dict[str, str]) -> Dict[str, Any]:
+            nonlocal next_slot
+            async with sem:
+                # Single-threaded loop: claiming a slot needs no lock
+                slot = max(next_slot, time.monotonic())
+                next_slot = slot + delay_seconds
+                await asyncio.sleep(slot - time.monotonic())
+                
+                return await self.send_email_async(
+                    to_email=email_data.get('to_email'),
+                    subject=email_data.get('subject'),
+                    body=email_data.get('body'),
+                    to_name=email_data.get('to_name')
+                )
+        
+        results = await asyncio.gather(*(send(email_data) for email_data in emails), return_exceptions=True)
+        
+        return [
+            {"status": "failed", "email": email_data.get('to_email'), "error": str(result)}
+            if isinstance(result, Exception) else result
+            for email_data, result in zip(emails, results)
+        ]
+    
+    def _is_retryable(self, error: httpx.HTTPError) -> bool:
+        """
+        Retry 429/5xx responses and failed connects only
+        
+        Read errors and timeouts are not retried: the mail may already have been
+        accepted, and resending it would deliver a duplicate.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRY_STATUS_CODES
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+    
+    def _headers(self) -> Dict[str, str]:
+        """Request headers for the v3 API"""
+        return {"Authorization": f"Bearer {self.api_key}"}
+    
+    def _mail_body(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        to_name: Optional[str]
+    ) -> Dict[str, Any]:
+        """v3 mail/send request body for a single plain-text email"""
+        recipient = {"email": to_email, "name": to_name} if to_name else {"email": to_email}
+        return {
+            "personalizations": [{"to": [recipient]}],
+            "from": {"email": self.from_email, "name": self.from_name},
+            "subject": subject,
+            "content": [{"type": "text/plain", "value": body}]
+        }
+    
+    def _broadcast_body(
+        self,
+        recipients: List[Dict[str, str]],
+        subject: str,
+        body: str
+    ) -> Dict[str, Any]:
+        """v3 mail/send request body with one personalization per recipient"""
+        personalizations = [
+            {"to": [{"email": r['to_email'], "name": r['to_name']} if r.get('to_name') else {"email": r['to_email']}]}
+            for r in recipients
+        ]
+        return {
+            "personalizations": personalizations,
+            "from": {"email": self.from_email, "name": self.from_name},
+            "subject": subject,
+            "content": [{"type": "text/plain", "value": body}]
+        }
     
     def _mock_send_email(
         self,
@@ -137,24 +472,23 @@ class SendGridTool:
         body: str
     ) -> Dict[str, Any]:
         """Mock email sending"""
-        logger.info(f"MOCK MODE: Simulating email send to {to_email}")
-        logger.debug(f"   Subject: {subject}")
-        logger.debug(f"   Body: {body[:100]}...")
+        logger.info("MOCK MODE: Simulating email send to %s", to_email)
+        logger.debug("   Subject: %s", subject)
+        logger.debug("   Body: %.100s...", body)
         
         # Simulate 10% failure rate in mock mode
-        import random
-        if random.random() < 0.1:
+        if _rng().random() < 0.1:
             return {
                 "status": "failed",
                 "email": to_email,
                 "error": "Mock failure: Simulated bounce",
-                "sent_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                "sent_at": timestamp_now()
             }
         
         return {
             "status": "sent",
             "email": to_email,
             "subject": subject,
-            "message_id": f"mock_msg_{int(time.time())}_{hash(to_email) % 10000}",
-            "sent_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            "message_id": f"mock_msg_{uuid.uuid4().hex[:12]}",
+            "sent_at": timestamp_now()
         }
\ No newline at end of file
@@ -2,6 +2,12 @@
 from .logger import get_logger, WorkflowLogger
 from .config_loader import get_config, ConfigLoader
 from .json_validator import validate_workflow_file, WorkflowValidator
+from .timing import Timed, TIMINGS, format_timings, run_standalone_tests
+from .clock import timestamp_now
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .request_batcher import RequestBatcher
+from .async_runner import run_sync
+from .http_client import HTTPClientMixin
 
 __all__ = [
     'get_logger',
@@ -9,7 +15,17 @@ __all__ = [
     'get_config',
     'ConfigLoader',
     'validate_workflow_file',
-    'WorkflowValidator'
+    'WorkflowValidator',
+    'Timed',
+    'TIMINGS',
+    'format_timings',
+    'run_standalone_tests',
+    'timestamp_now',
+    'RateLimiter',
+    'get_rate_limiter',
+    'RequestBatcher',
+    'run_sync',
+    'HTTPClientMixin'
 ]
 
 
@@ -0,0 +1,32 @@
+"""
+Bridge from synchronous entry points to the async API clients
+"""
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(main: Callable[[], Awaitable[T]], async_alternative: str) -> T:
+    """
+    Run a coroutine function to completion on a fresh event loop
+    
+    The coroutine is only created once we know no loop is running, so a
+    misuse fails with a clear error instead of an un-awaited coroutine.
+    
+    Args:
+        main: Zero-argument coroutine function; should close any loop-bound clients it opened
+        async_alternative: What callers inside an event loop should await instead
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        RuntimeError: If called from a thread that is already running an event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
+    
+    raise RuntimeError(f"Cannot block on an event loop that is already running; await {async_alternative} instead")
@@ -0,0 +1,19 @@
+"""
+Wall-clock helpers shared by the vendor API tools
+"""
+import time
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_timestamp_cache = (-1, "")
+
+
+def timestamp_now() -> str:
+    """Current local time as TIMESTAMP_FORMAT text, re-rendered at most once per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+        # Tuple swap keeps second and text consistent across threads
+        _timestamp_cache = (second, text)
+    return text
@@ -2,13 +2,21 @@
 Configuration and environment variable loader
 """
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from utils.logger import get_logger
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = get_logger("config_loader")
 
 class APIConfig(BaseModel):
@@ -18,12 +26,13 @@ class APIConfig(BaseModel):
     timeout: int = 30
     max_retries: int = 3
 
-class WorkflowConfig(BaseModel):
-    """Main Workflow Configuration"""
-    max_leads_per_run: int = Field(default=100)
-    enable_mock_mode: bool = Field(default=True)
-    dry_run: bool = Field(default=False)
-    log_level: str = Field(default="INFO")
+@dataclass(frozen=True, slots=True)
+class WorkflowConfig:
+    """Main Workflow Configuration (read on every tool construction, so kept plain)"""
+    max_leads_per_run: int = 100
+    enable_mock_mode: bool = True
+    dry_run: bool = False
+    log_level: str = "INFO"
 
 class ConfigLoader:
     """Load and manage configuration from .env and YAML files"""
@@ -32,6 +41,8 @@ class ConfigLoader:
         self.env_file = Path(env_file)
         self.config_file = Path(config_file)
         self.config: Dict[str, Any] = {}
+        self._env: Dict[str, str] = {}
+        self._workflow_config = WorkflowConfig()
         
         # Load environment variables
         self._load_env()
@@ -40,35 +51,56 @@ class ConfigLoader:
         if self.config_file.exists():
             self._load_yaml()
         else:
-            logger.warning(f"Config file {config_file} not found, using defaults")
+            logger.warning("Config file %s not found, using defaults", config_file)
     
     def _load_env(self):
         """Load environment variables from .env file"""
         if self.env_file.exists():
             load_dotenv(self.env_file)
-            logger.info(f"Loaded environment variables from {self.env_file}")
+            logger.info("Loaded environment variables from %s", self.env_file)
         else:
-            logger.warning(f"  .env file not found at {self.env_file}")
+            logger.warning("  .env file not found at %s", self.env_file)
+        
+        # Snapshot so lookups are plain dict reads; refreshed by reload()
+        self._env = dict(os.environ)
+        self._workflow_config = WorkflowConfig(
+            max_leads_per_run=int(self.get_env("MAX_LEADS_PER_RUN", 100)),
+            enable_mock_mode=self.get_env("ENABLE_MOCK_MODE", "true").lower() == "true",
+            dry_run=self.get_env("DRY_RUN", "false").lower() == "true",
+            log_level=self.get_env("LOG_LEVEL", "INFO")
+        )
     
     def _load_yaml(self):
         """Load configuration from YAML file"""
         try:
-            with open(self.config_file, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-            logger.info(f"Loaded configuration from {self.config_file}")
+            self.config = yaml.load(self.config_file.read_bytes(), Loader=_YamlLoader) or {}
+            logger.info("Loaded configuration from %s", self.config_file)
         except Exception as e:
-            logger.error(f" Failed to load config file: {e}")
+            logger.error(" Failed to load config file: %s", e)
             self.config = {}
     
+    def reload(self):
+        """Re-read .env, the environment and the YAML file, dropping memoized configs"""
+        self._load_env()
+        if self.config_file.exists():
+            self._load_yaml()
+        self._api_config.cache_clear()
+    
     def get_env(self, key: str, default: Any = None) -> Any:
         """Get environment variable"""
-        value = os.getenv(key, default)
+        value = self._env.get(key, default)
         if value is None:
-            logger.warning(f"  Environment variable {key} not found")
+            logger.warning("  Environment variable %s not found", key)
         return value
     
     def get_api_config(self, service: str) -> Dict[str, Any]:
         """Get API configuration for a service"""
+        # Copy so callers can't mutate the memoized dict
+        return dict(self._api_config(service.lower()))
+    
+    @lru_cache(maxsize=None)
+    def _api_config(self, service: str) -> Dict[str, Any]:
+        """Build the API configuration for a lowercased service name (memoized)"""
         api_key_map = {
             "gemini": "GEMINI_API_KEY",
             "clay": "CLAY_API_KEY",
@@ -77,10 +109,10 @@ class ConfigLoader:
             "sendgrid": "SENDGRID_API_KEY",
         }
         
-        api_key = self.get_env(api_key_map.get(service.lower()))
+        api_key = self.get_env(api_key_map.get(service))
         
         if not api_key:
-            logger.warning(f" API key for {service} not found")
+            logger.warning(" API key for %s not found", service)
             return {"api_key": "", "mock_mode": True}
         
         return {
@@ -89,13 +121,8 @@ class ConfigLoader:
         }
     
     def get_workflow_config(self) -> WorkflowConfig:
-        """Get workflow configuration"""
-        return WorkflowConfig(
-            max_leads_per_run=int(self.get_env("MAX_LEADS_PER_RUN", 100)),
-            enable_mock_mode=self.get_env("ENABLE_MOCK_MODE", "true").lower() == "true",
-            dry_run=self.get_env("DRY_RUN", "false").lower() == "true",
-            log_level=self.get_env("LOG_LEVEL", "INFO")
-        )
+        """Get workflow configuration (built from the environment snapshot, refreshed by reload())"""
+        return self._workflow_config
     
     def get_yaml_config(self, key: str, default: Any = None) -> Any:
         """Get value from YAML config"""
@@ -107,7 +134,7 @@ class ConfigLoader:
                 value = value[k]
             return value
         except (KeyError, TypeError):
-            logger.warning(f"  Config key {key} not found, using default")
+            logger.warning("  Config key %s not found, using default", key)
             return default
     
     def get_icp_config(self) -> Dict[str, Any]:
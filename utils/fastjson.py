@@ -0,0 +1,61 @@
+"""
+Fast JSON helpers backed by orjson for saving workflow results
+"""
+from typing import Any, Union
+
+import orjson
+
+# numpy arrays and non-string keys show up in agent outputs
+DEFAULT_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to JSON bytes
+
+    Args:
+        obj: Object to serialize; unsupported values fall back to str()
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    option = DEFAULT_OPTIONS | orjson.OPT_INDENT_2 if indent else DEFAULT_OPTIONS
+    return orjson.dumps(obj, default=str, option=option)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or str"""
+    return orjson.loads(data)
+
+
+def dump_file(obj: Any, path: str, indent: bool = True):
+    """
+    Write obj as JSON to path
+
+    Top-level dict values are serialized one at a time so a large workflow
+    state is never held twice in memory as a single encoded blob.
+
+    Args:
+        obj: Object to write
+        path: Output file path
+        indent: Pretty-print with 2-space indentation
+    """
+    with open(path, "wb") as f:
+        if not isinstance(obj, dict) or not obj:
+            f.write(dumps(obj, indent))
+            return
+
+        separator = b",\n  " if indent else b","
+        f.write(b"{\n  " if indent else b"{")
+
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                f.write(separator)
+            f.write(dumps(key if isinstance(key, str) else str(key)))
+            f.write(b": " if indent else b":")
+            encoded = dumps(value, indent)
+            # Nested lines need one extra level; newlines inside strings are escaped
+            f.write(encoded.replace(b"\n", b"\n  ") if indent else encoded)
+
+        f.write(b"\n}" if indent else b"}")
@@ -0,0 +1,116 @@
+"""
+Connection pooling and retry plumbing shared by the vendor API tools
+"""
+import asyncio
+import random
+from contextlib import nullcontext
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from utils.logger import get_logger
+
+logger = get_logger("http_client")
+
+
+class HTTPClientMixin:
+    """
+    Pooled sync session plus a per-event-loop httpx.AsyncClient with retries
+
+    Clients set self.timeout and self.max_retries (total attempts), may set
+    self._session (a requests.Session) and self._rate_limiter, and override
+    _headers() and the class-level settings below as needed.
+    """
+
+    ASYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    HTTP2 = False
+
+    # Statuses worth retrying; any other 4xx fails immediately
+    RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    # Non-2xx statuses handed back to the caller instead of raised (e.g. 304)
+    PASSTHROUGH_STATUS_CODES: Tuple[int, ...] = ()
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 30.0
+    RETRY_JITTER = 0.5
+
+    _session = None
+    _rate_limiter = None
+    _async_client: Optional[httpx.AsyncClient] = None
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _headers(self) -> Dict[str, str]:
+        """Default headers for every request"""
+        return {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        # An AsyncClient's connections are bound to the loop that opened them
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                http2=self.HTTP2,
+                timeout=self.timeout,
+                headers=self._headers(),
+                limits=self.ASYNC_LIMITS
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def _arequest_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """Make async HTTP request with retry logic"""
+        client = self._get_async_client()
+        for attempt in range(self.max_retries):
+            try:
+                async with self._rate_limiter or nullcontext():
+                    response = await client.request(method, url, **kwargs)
+                if response.status_code not in self.PASSTHROUGH_STATUS_CODES:
+                    response.raise_for_status()
+                return response
+
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries - 1 or not self._is_retryable(e):
+                    raise
+
+                response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+                wait_time = self._retry_delay(attempt, response)
+                logger.warning(
+                    "%s retry %s/%s after %.2fs", type(self).__name__, attempt + 1, self.max_retries, wait_time
+                )
+                await asyncio.sleep(wait_time)
+
+    def _is_retryable(self, error: httpx.HTTPError) -> bool:
+        """Transport errors and RETRY_STATUS_CODES responses are worth retrying"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.RETRY_STATUS_CODES
+        return isinstance(error, httpx.TransportError)
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        """Capped, jittered exponential backoff that waits at least as long as Retry-After"""
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, self.RETRY_JITTER))
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(self.RETRY_MAX_DELAY, float(retry_after)))
+        return delay
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        if self._session is not None:
+            self._session.close()
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+    async def aclose(self):
+        """Close the async HTTP client"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
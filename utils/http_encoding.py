@@ -0,0 +1,11 @@
+"""
+Content-encoding negotiation shared by the HTTP-based tools
+"""
+# urllib3/httpx only decode Brotli when a brotli package is importable
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+ACCEPT_ENCODING = "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate"
@@ -1,14 +1,27 @@
 """
 Workflow JSON Schema Validator
 """
+import hashlib
 import json
+import os
+from collections import Counter
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, ValidationError, field_validator
+from utils import fastjson
 from utils.logger import get_logger
 
 logger = get_logger("json_validator")
 
+# Step id at the start of a template reference, e.g. "{{prospect_search.output.leads}}";
+# matched against serialized inputs so nested values are covered in one scan
+_REF_RE = re.compile(rb"\{\{\s*(\w+)\.")
+
+# Validated workflow definitions are persisted as JSON in this directory, next to
+# the workflow file, between CLI runs
+CACHE_DIR_NAME = ".cache"
+
 class ToolConfig(BaseModel):
     """Tool configuration schema"""
     name: str
@@ -69,20 +82,75 @@ class WorkflowDefinition(BaseModel):
             raise ValueError("Workflow must have at least one step")
         
         # Check for duplicate IDs
-        step_ids = [step.id for step in v]
-        if len(step_ids) != len(set(step_ids)):
-            duplicates = [sid for sid in step_ids if step_ids.count(sid) > 1]
+        counts = Counter(step.id for step in v)
+        duplicates = [sid for sid, count in counts.items() if count > 1]
+        if duplicates:
             raise ValueError(f"Duplicate step IDs found: {duplicates}")
         
         return v
 
+def _construct_definition(dumped: Dict[str, Any]) -> WorkflowDefinition:
+    """Rebuild a definition from its model_dump() without re-running validation"""
+    steps = [
+        WorkflowStep.model_construct(**(step | {"tools": [ToolConfig.model_construct(**tool) for tool in step["tools"]]}))
+        for step in dumped["steps"]
+    ]
+    return WorkflowDefinition.model_construct(**(dumped | {"steps": steps}))
+
 class WorkflowValidator:
     """Validate workflow.json against schema"""
     
-    def __init__(self, workflow_file: str = "workflow.json"):
+    def __init__(self, workflow_file: str = "workflow.json", use_cache: bool = True):
         self.workflow_file = Path(workflow_file)
+        self.use_cache = use_cache
         self.workflow_data: Optional[Dict[str, Any]] = None
         self.workflow_definition: Optional[WorkflowDefinition] = None
+        self._step_index: Dict[str, WorkflowStep] = {}
+        # SHA-256 of the file bytes workflow_data was parsed from
+        self._content_hash: Optional[str] = None
+    
+    def _cache_path(self) -> Path:
+        """Cache file beside the workflow file, independent of the working directory"""
+        return self.workflow_file.resolve().parent / CACHE_DIR_NAME / f"workflow_{self.workflow_file.stem}.json"
+    
+    def _load_cached(self) -> Optional[Tuple[Dict[str, Any], WorkflowDefinition]]:
+        """Return the raw data and definition validated on a previous run, if the file content is unchanged"""
+        if not self.workflow_file.exists():
+            return None
+        
+        raw = self.workflow_file.read_bytes()
+        try:
+            cached = fastjson.loads(self._cache_path().read_bytes())
+            if cached["sha256"] != hashlib.sha256(raw).hexdigest():
+                return None
+            definition = _construct_definition(cached["definition"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Caches written by an older layout are simply revalidated
+            logger.debug(f"Ignoring unreadable workflow cache: {e}")
+            return None
+        
+        self._content_hash = cached["sha256"]
+        return fastjson.loads(raw), definition
+    
+    def _store_cached(self, definition: WorkflowDefinition):
+        """Persist a validated definition, keyed by the hash of the content it came from"""
+        if self._content_hash is None:
+            # workflow_data was supplied directly rather than read from the file
+            return
+        
+        path = self._cache_path()
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(fastjson.dumps({
+                "sha256": self._content_hash,
+                "definition": definition.model_dump()
+            }))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write workflow cache: {e}")
     
     def load_workflow(self) -> Dict[str, Any]:
         """Load workflow JSON file"""
@@ -90,8 +158,9 @@ class WorkflowValidator:
             raise FileNotFoundError(f"Workflow file not found: {self.workflow_file}")
         
         try:
-            with open(self.workflow_file, 'r') as f:
-                self.workflow_data = json.load(f)
+            raw = self.workflow_file.read_bytes()
+            self._content_hash = hashlib.sha256(raw).hexdigest()
+            self.workflow_data = fastjson.loads(raw)
             logger.info(f" Loaded workflow from {self.workflow_file}")
             return self.workflow_data
         except json.JSONDecodeError as e:
@@ -100,13 +169,25 @@ class WorkflowValidator:
     
     def validate(self) -> bool:
         """Validate workflow against schema"""
+        if self.use_cache and not self.workflow_data:
+            cached = self._load_cached()
+            if cached is not None:
+                # workflow_data is restored too, so callers see the same state as after a full load
+                self.workflow_data, self.workflow_definition = cached
+                self._step_index = {step.id: step for step in self.workflow_definition.steps}
+                logger.info(f" Loaded validated workflow from cache: {self.workflow_definition.workflow_name}")
+                return True
+        
         if not self.workflow_data:
             self.load_workflow()
         
         try:
             self.workflow_definition = WorkflowDefinition(**self.workflow_data)
+            self._step_index = {step.id: step for step in self.workflow_definition.steps}
             logger.info(f" Workflow validation passed: {self.workflow_definition.workflow_name}")
             logger.info(f"   Total steps: {len(self.workflow_definition.steps)}")
+            if self.use_cache:
+                self._store_cached(self.workflow_definition)
             return True
         except ValidationError as e:
             logger.error(f" Workflow validation failed:")
@@ -125,29 +206,25 @@ class WorkflowValidator:
         if not self.workflow_definition:
             self.validate()
         
-        for step in self.workflow_definition.steps:
-            if step.id == step_id:
-                return step
-        
-        logger.warning(f"  Step {step_id} not found in workflow")
-        return None
+        step = self._step_index.get(step_id)
+        if step is None:
+            logger.warning(f"  Step {step_id} not found in workflow")
+        return step
     
     def validate_dependencies(self) -> bool:
         """Validate that step dependencies exist"""
         if not self.workflow_definition:
             self.validate()
         
-        step_ids = {step.id for step in self.workflow_definition.steps}
+        step_ids = self._step_index.keys()
         
         for step in self.workflow_definition.steps:
             # Check if input references exist
-            for key, value in step.inputs.items():
-                if isinstance(value, str) and "{{" in value and "}}" in value:
-                    # Extract referenced step ID (e.g., "{{prospect_search.output.leads}}")
-                    ref_step_id = value.split("{{")[1].split(".")[0]
-                    if ref_step_id != "config" and ref_step_id not in step_ids:
-                        logger.error(f"Step {step.id} references non-existent step: {ref_step_id}")
-                        return False
+            for ref in _REF_RE.findall(fastjson.dumps(step.inputs)):
+                ref_step_id = ref.decode()
+                if ref_step_id != "config" and ref_step_id not in step_ids:
+                    logger.error(f"Step {step.id} references non-existent step: {ref_step_id}")
+                    return False
         
         logger.info(" All step dependencies validated")
         return True
@@ -1,13 +1,98 @@
 """
 Centralized logging utility for AI Agent Workflow
 """
+import atexit
+import functools
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 import colorlog
 import os
 
+# Records are formatted and written on one background thread; callers only enqueue
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_handlers_by_name: dict = {}
+_listener: QueueListener = None
+_listener_lock = threading.Lock()
+# Set in forked children, which log synchronously (see _after_fork_in_child)
+_direct = False
+
+# Resolved once per process rather than per logger
+_LOG_DIR = Path("logs")
+_LOG_DIR.mkdir(exist_ok=True)
+_TODAY = datetime.now().strftime('%Y%m%d')
+_LEVEL_CACHE: dict = {}
+
+
+def _resolve_level(level_name: str) -> int:
+    """Map a level name like "info" to its logging constant"""
+    level = _LEVEL_CACHE.get(level_name)
+    if level is None:
+        level = _LEVEL_CACHE[level_name] = getattr(logging, level_name.upper())
+    return level
+
+
+class _RoutingHandler(logging.Handler):
+    """Hand each queued record to the console/file handlers of the logger that made it"""
+    
+    def emit(self, record: logging.LogRecord):
+        for handler in _handlers_by_name.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _start_listener():
+    """Start the shared queue listener once per process"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_log_queue, _RoutingHandler())
+            _listener.start()
+            # Drain anything still queued at interpreter exit
+            atexit.register(_listener.stop)
+
+
+def _attach_handlers(logger: logging.Logger, handlers: tuple):
+    """Route a logger's records through the queue, or straight to handlers in a forked child"""
+    if _direct:
+        for handler in handlers:
+            logger.addHandler(handler)
+    else:
+        logger.addHandler(QueueHandler(_log_queue))
+        _start_listener()
+
+
+def _after_fork_in_child():
+    """
+    Detach forked children from the parent's queue
+    
+    A child inherits _listener as started but not its thread, so queued
+    records would never be written, and the old queue's lock may have been
+    held mid-put at fork time. Fork-based workers also leave via os._exit,
+    skipping the atexit drain, so the child writes synchronously instead.
+    """
+    global _direct, _listener, _listener_lock, _log_queue
+    _direct = True
+    _listener = None
+    _listener_lock = threading.Lock()
+    _log_queue = queue.Queue(-1)
+    
+    for name, handlers in _handlers_by_name.items():
+        logger = logging.getLogger(name)
+        for handler in [h for h in logger.handlers if isinstance(h, QueueHandler)]:
+            logger.removeHandler(handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 class WorkflowLogger:
     """Custom logger with colored output and file logging"""
     
@@ -19,10 +104,12 @@ class WorkflowLogger:
     def _setup_logger(self) -> logging.Logger:
         """Setup logger with both console and file handlers"""
         logger = logging.getLogger(self.name)
-        logger.setLevel(getattr(logging, self.log_level.upper()))
+        logger.setLevel(_resolve_level(self.log_level))
         
-        # Clear existing handlers
-        logger.handlers = []
+        # Already wired up (e.g. a second WorkflowLogger for this name): don't
+        # open another log file
+        if logger.handlers and self.name in _handlers_by_name:
+            return logger
         
         # Console handler with colors
         console_handler = colorlog.StreamHandler(sys.stdout)
@@ -40,13 +127,9 @@ class WorkflowLogger:
             }
         )
         console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
         
         # File handler
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f"{self.name}_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = _LOG_DIR / f"{self.name}_{_TODAY}.log"
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         
@@ -55,36 +138,53 @@ class WorkflowLogger:
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        
+        # The logger itself only enqueues; the listener thread does the I/O
+        _handlers_by_name[self.name] = (console_handler, file_handler)
+        _attach_handlers(logger, _handlers_by_name[self.name])
         
         return logger
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message"""
-        self.logger.debug(message, extra=kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message; args are %-formatted only if the record is emitted"""
+        self.logger.debug(message, *args, extra=kwargs)
+    
+    def info(self, message: str, *args, **kwargs):
+        """Log info message; args are %-formatted only if the record is emitted"""
+        self.logger.info(message, *args, extra=kwargs)
     
-    def info(self, message: str, **kwargs):
-        """Log info message"""
-        self.logger.info(message, extra=kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning message; args are %-formatted only if the record is emitted"""
+        self.logger.warning(message, *args, extra=kwargs)
     
-    def warning(self, message: str, **kwargs):
-        """Log warning message"""
-        self.logger.warning(message, extra=kwargs)
+    def error(self, message: str, *args, **kwargs):
+        """Log error message; args are %-formatted only if the record is emitted"""
+        self.logger.error(message, *args, extra=kwargs)
     
-    def error(self, message: str, **kwargs):
-        """Log error message"""
-        self.logger.error(message, extra=kwargs)
+    def critical(self, message: str, *args, **kwargs):
+        """Log critical message; args are %-formatted only if the record is emitted"""
+        self.logger.critical(message, *args, extra=kwargs)
+    
+    def exception(self, message: str, *args, **kwargs):
+        """
+        Log an error from an except block
+        
+        The traceback is only formatted when DEBUG is enabled; other runs get
+        the one-line message, skipping the frame walk and source reads.
+        """
+        self.logger.error(message, *args, exc_info=self.isEnabledFor(logging.DEBUG), extra=kwargs)
     
-    def critical(self, message: str, **kwargs):
-        """Log critical message"""
-        self.logger.critical(message, extra=kwargs)
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a record at level would be emitted"""
+        return self.logger.isEnabledFor(level)
     
     def log_api_call(self, service: str, endpoint: str, status: str, response_time: float = None):
         """Log API call with structured format"""
-        msg = f"API Call | Service: {service} | Endpoint: {endpoint} | Status: {status}"
         if response_time:
-            msg += f" | Response Time: {response_time:.2f}s"
-        self.info(msg)
+            self.info("API Call | Service: %s | Endpoint: %s | Status: %s | Response Time: %.2fs",
+                      service, endpoint, status, response_time)
+        else:
+            self.info("API Call | Service: %s | Endpoint: %s | Status: %s", service, endpoint, status)
     
     def log_agent_start(self, agent_name: str, input_data: dict):
         """Log agent execution start"""
@@ -99,7 +199,8 @@ class WorkflowLogger:
         self.error(f" Agent Failed: {agent_name} | Error: {str(error)}")
 
 
-# Global logger instance
+# Global logger instances, one per name
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str = "workflow") -> WorkflowLogger:
     """Get or create logger instance"""
     return WorkflowLogger(name)
\ No newline at end of file
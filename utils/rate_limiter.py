@@ -0,0 +1,97 @@
+"""
+Token-bucket rate limiting shared by the vendor API tools
+"""
+import asyncio
+import threading
+import time
+from typing import Dict
+
+from utils.config_loader import get_config
+
+
+class RateLimiter:
+    """
+    Token bucket allowing max_rate calls per time_period, with a concurrency cap
+
+    Usable as a context manager from threads (`with limiter:`) and from
+    coroutines (`async with limiter:`); both share the same bucket.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0, max_concurrency: int = 10):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.max_concurrency = max_concurrency
+        self._fill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._sem = threading.BoundedSemaphore(max_concurrency)
+        self._async_sems: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self._fill_rate)
+            self._updated = now
+            # Tokens may go negative: later callers queue behind earlier reservations
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._fill_rate
+
+    def _async_sem(self) -> asyncio.Semaphore:
+        """Semaphore for the running event loop (asyncio primitives are loop-bound)"""
+        loop = asyncio.get_running_loop()
+        sem = self._async_sems.get(loop)
+        if sem is None:
+            # Drop semaphores left behind by closed loops
+            self._async_sems = {l: s for l, s in self._async_sems.items() if not l.is_closed()}
+            sem = self._async_sems[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+    def __enter__(self) -> "RateLimiter":
+        self._sem.acquire()
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._sem.release()
+        return False
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self._async_sem().acquire()
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self._async_sem().release()
+        return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(service: str) -> RateLimiter:
+    """
+    Get the process-wide limiter for a service, configured from rate_limits in config.yaml
+
+    Args:
+        service: Service name, e.g. "apollo" or "clay"
+
+    Returns:
+        Shared RateLimiter for that service
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(service)
+        if limiter is None:
+            limits = get_config().get_yaml_config(f"rate_limits.{service}", {})
+            limiter = _limiters[service] = RateLimiter(
+                max_rate=limits.get("requests_per_minute", 60),
+                time_period=60.0,
+                max_concurrency=limits.get("max_concurrency", 10)
+            )
+        return limiter
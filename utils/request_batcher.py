@@ -0,0 +1,94 @@
+"""
+Coalescing request batcher for APIs that are cheaper to call in groups
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Handler receives the batch key and the buffered items, and returns one
+# result (or exception instance) per item, in order
+BatchHandler = Callable[[Hashable, List[Any]], Awaitable[List[Any]]]
+
+
+class RequestBatcher:
+    """
+    Buffer submitted items for up to linger_ms and dispatch them in batches
+
+    Items are grouped by key so only compatible requests (e.g. the same
+    generation config) share a batch. A batch is flushed when it reaches
+    max_batch_size or when its linger window expires, whichever is first.
+    Batches run on a private event loop thread, so submit() is safe to call
+    from any thread, including worker threads of a parallel graph step.
+    """
+
+    def __init__(self, handler: BatchHandler, max_batch_size: int = 8, linger_ms: float = 50):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.linger = linger_ms / 1000
+        self._pending: Dict[Hashable, List[Tuple[Any, Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, key: Hashable, item: Any) -> Future:
+        """
+        Queue an item for batching
+
+        Args:
+            key: Batch group; only items with equal keys are dispatched together
+            item: Request payload passed to the handler
+
+        Returns:
+            Future resolving to the handler's result for this item
+        """
+        future: Future = Future()
+        self._ensure_loop().call_soon_threadsafe(self._enqueue, key, item, future)
+        return future
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the dispatch loop thread on first use"""
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="request-batcher", daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
+    def _enqueue(self, key: Hashable, item: Any, future: Future):
+        """Add an item to its group; runs on the dispatch loop"""
+        batch = self._pending.setdefault(key, [])
+        batch.append((item, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = self._loop.call_later(self.linger, self._flush, key)
+
+    def _flush(self, key: Hashable):
+        """Dispatch everything buffered under key"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(key, None)
+        if batch:
+            self._loop.create_task(self._dispatch(key, batch))
+
+    async def _dispatch(self, key: Hashable, batch: List[Tuple[Any, Future]]):
+        """Run the handler and resolve each caller's future"""
+        try:
+            results = await self.handler(key, [item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        if len(results) != len(batch):
+            error = RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,61 @@
+"""
+Lightweight step timing and parallel runners for test runs and workflow profiling
+"""
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+# Per-step wall time in nanoseconds, keyed by step name
+TIMINGS: Dict[str, int] = {}
+
+
+class Timed:
+    """Context manager that records a perf_counter_ns delta into TIMINGS"""
+
+    def __init__(self, name: str, timings: Optional[Dict[str, int]] = None):
+        self.name = name
+        self.timings = TIMINGS if timings is None else timings
+        self._start = 0
+
+    def __enter__(self) -> "Timed":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.timings[self.name] = time.perf_counter_ns() - self._start
+        return False
+
+
+def format_timings(timings: Optional[Dict[str, int]] = None) -> str:
+    """Render recorded timings as an indented JSON summary"""
+    return orjson.dumps(
+        TIMINGS if timings is None else timings,
+        option=orjson.OPT_INDENT_2
+    ).decode()
+
+
+def run_standalone_tests(tests: List[Tuple[str, Callable[[], Any]]]) -> List[Tuple[str, Any]]:
+    """
+    Run independent standalone tests in parallel worker processes
+    
+    Workers are forked so they inherit already-imported modules instead of
+    re-importing them; utils.logger switches forked children to synchronous
+    logging so their output isn't lost. Falls back to running the tests in
+    order where fork isn't available.
+    
+    Args:
+        tests: (name, zero-argument test function) pairs
+        
+    Returns:
+        (name, result) pairs in the same order as tests
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return [(name, test()) for name, test in tests]
+    
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=len(tests), mp_context=context) as pool:
+        futures = [(name, pool.submit(test)) for name, test in tests]
+        return [(name, future.result()) for name, future in futures]